@@ -0,0 +1,188 @@
+"""
+Render benchmarks for every scene at every quality preset.
+
+Each scene/quality pair is rendered in a fresh process (so peak memory and caches
+don't leak between runs) with manim's partial movie caching off, recording:
+    - wall time,
+    - frames written and frames per second,
+    - peak RSS,
+    - how many times latex actually ran.
+Results go to a JSON file, which can be compared against a stored baseline.
+
+Usage:
+    python bench.py run [-q l m h k] [--cold-tex] [-o results.json] [Scene ...]
+    python bench.py compare baseline.json results.json [--threshold 10]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from render_all import QUALITIES, SCENES
+
+
+def _measure(scene_name, quality, cache_dir):
+    # Runs in a fresh process: the cache location has to be set before anything imports it
+    if cache_dir is not None:
+        os.environ["CYLOPT_CACHE_DIR"] = cache_dir
+
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    import tex_cache
+    from render_all import render_scene
+
+    frames = 0
+    original_write_frame = SceneFileWriter.write_frame
+
+    def write_frame(self, *args, **kwargs):
+        nonlocal frames
+        frames += 1
+        return original_write_frame(self, *args, **kwargs)
+
+    SceneFileWriter.write_frame = write_frame
+
+    options = {"disable_caching": True}
+    if cache_dir is not None:
+        # Manim reuses the SVGs already in media/Tex without running latex, so those go too
+        options["tex_dir"] = os.path.join(cache_dir, "Tex")
+
+    start = time.perf_counter()
+    render_scene(scene_name, quality, options)
+    seconds = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak_rss *= 1024
+
+    return {
+        "seconds": seconds,
+        "frames": frames,
+        "fps": frames / seconds if seconds else 0.0,
+        "peak_rss_mb": peak_rss / 1024 ** 2,
+        "latex_runs": tex_cache.latex_runs,
+    }
+
+
+def run_benchmarks(scene_names=None, qualities=None, cold_tex=False):
+    """
+    Benchmarks scenes one at a time, each render in its own process.
+
+    Args:
+    scene_names (list): Scenes to benchmark, defaults to all of them.
+    qualities (list): Manim quality names, defaults to low, medium, high and 4K.
+    cold_tex (bool): Start every render with an empty tex cache and tex folder, so
+        the latex cost is part of the measurement.
+
+    Returns:
+    dict: {"meta": {...}, "results": {scene: {quality: measurements}}}
+    """
+    scene_names = scene_names or [name for name, _ in SCENES]
+    qualities = qualities or [QUALITIES[flag] for flag in "lmhk"]
+    context = multiprocessing.get_context("spawn")
+
+    results = {}
+    for scene_name in scene_names:
+        results[scene_name] = {}
+        for quality in qualities:
+            with tempfile.TemporaryDirectory() as cold_dir:
+                cache_dir = cold_dir if cold_tex else None
+                # A new single-use pool per render, so every measurement starts from scratch
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    try:
+                        result = pool.submit(_measure, scene_name, quality, cache_dir).result()
+                    except Exception as e:
+                        result = {"error": f"{type(e).__name__}: {e}"}
+            results[scene_name][quality] = result
+            print(f"{scene_name:<22}{quality:<20}{_format(result)}", flush=True)
+
+    meta = {
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "cold_tex": cold_tex,
+    }
+    return {"meta": meta, "results": results}
+
+
+def _format(result):
+    if "error" in result:
+        return f"FAILED ({result['error']})"
+    return (f"{result['seconds']:8.1f}s {result['frames']:6d} frames {result['fps']:7.1f} fps "
+            f"{result['peak_rss_mb']:7.0f} MB {result['latex_runs']:4d} latex runs")
+
+
+def compare(baseline, current, threshold=10.0):
+    """
+    Finds scene/quality pairs that got slower than a baseline.
+
+    Args:
+    baseline (dict): Benchmark results to compare against.
+    current (dict): New benchmark results.
+    threshold (float): Allowed slowdown, in percent.
+
+    Returns:
+    list: (scene, quality, baseline seconds, current seconds, percent change) for
+        every regression.
+    """
+    regressions = []
+    for scene_name, qualities in current["results"].items():
+        for quality, result in qualities.items():
+            old = baseline["results"].get(scene_name, {}).get(quality)
+            if old is None or "error" in old:
+                continue
+            if "error" in result:
+                regressions.append((scene_name, quality, old["seconds"], float("inf"), float("inf")))
+                continue
+            change = (result["seconds"] - old["seconds"]) / old["seconds"] * 100
+            if change > threshold:
+                regressions.append((scene_name, quality, old["seconds"], result["seconds"], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene renders.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks")
+    run.add_argument("scenes", nargs="*")
+    run.add_argument("-q", "--quality", nargs="+", choices=QUALITIES, default=list("lmhk"))
+    run.add_argument("--cold-tex", action="store_true", help="Use an empty tex cache for every render")
+    run.add_argument("-o", "--output", default="bench_results.json")
+
+    cmp = commands.add_parser("compare", help="Flag scenes that got slower than a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown in percent")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run_benchmarks(args.scenes or None, [QUALITIES[q] for q in args.quality], args.cold_tex)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"Wrote {args.output}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    regressions = compare(baseline, current, args.threshold)
+    for scene_name, quality, old, new, change in regressions:
+        print(f"SLOWER: {scene_name} @ {quality}: {old:.1f}s -> {new:.1f}s (+{change:.0f}%)")
+    if not regressions:
+        print(f"No scene got more than {args.threshold:g}% slower")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
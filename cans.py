@@ -0,0 +1,285 @@
+"""
+The can catalog, and a batch renderer for it.
+
+Every product analysed in the video (how close its can is to the most volume
+efficient cylinder for its surface area) is one entry in cans.json, or in any
+CSV/JSON file with the same fields:
+    - name: Scene class / output file name, has to be a valid Python identifier.
+    - image: Photo of the product, relative to the catalog file. Optional.
+    - r or d: Radius or diameter in cm.
+    - h: Height in cm.
+    - display_scale: Scene units per cm for the cylinder drawing. Optional, by
+      default the can is fitted into the left half of the frame.
+    - narrated: Use the longer holds of the voiced-over version. Optional.
+    - percent_digits: Decimals the efficiency percentage is shown with. Optional,
+      2 by default.
+The CanAnalysis scene in cylinder_optimization.py works out everything it shows
+from these, so adding a product is adding a row.
+
+render_catalog() renders every entry in a process pool. The tex shared between
+products (all the formulas, only the numbers differ) is compiled once up front,
+by building the first product's scene without rendering anything, so the workers
+only compile their own numbers.
+
+Usage:
+    python cans.py [-c CATALOG] [-q l|m|h|p|k] [-j WORKERS] [Name ...]
+"""
+import argparse
+import csv
+import functools
+import json
+import math
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from efficiency import analyze
+
+CATALOG_FILE = Path(__file__).with_name("cans.json")
+
+# Roughly the space the can drawing gets next to its measurements
+MAX_DISPLAY_HEIGHT = 4.5
+MAX_DISPLAY_WIDTH = 3
+
+
+def _parse_bool(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes", "y")
+    return bool(value)
+
+
+def _normalize(entry, base_dir):
+    name = str(entry["name"]).strip()
+    if not name.isidentifier():
+        raise ValueError(f"Can name {name!r} isn't a valid Python identifier")
+
+    if entry.get("r") not in (None, ""):
+        r = float(entry["r"])
+    elif entry.get("d") not in (None, ""):
+        r = float(entry["d"]) / 2
+    else:
+        raise ValueError(f"{name} needs either r or d")
+    h = float(entry["h"])
+    if r <= 0 or h <= 0:
+        raise ValueError(f"{name} has a non-positive dimension")
+
+    image = entry.get("image") or None
+    if image is not None:
+        # Catalogs written on Windows use backslashes, which are part of the file name elsewhere
+        image = str((base_dir / image.replace("\\", "/")).resolve())
+
+    display_scale = entry.get("display_scale")
+    if display_scale in (None, ""):
+        display_scale = min(MAX_DISPLAY_HEIGHT / (2 * h), MAX_DISPLAY_WIDTH / (4 * r))
+
+    percent_digits = entry.get("percent_digits")
+    percent_digits = 2 if percent_digits in (None, "") else int(percent_digits)
+    if percent_digits < 0:
+        raise ValueError(f"{name} has a negative percent_digits")
+
+    return {
+        "name": name,
+        "image": image,
+        "r": r,
+        "h": h,
+        "display_scale": float(display_scale),
+        "narrated": _parse_bool(entry.get("narrated", False)),
+        "percent_digits": percent_digits,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def load_catalog(path=CATALOG_FILE):
+    """
+    Reads a can catalog.
+
+    Args:
+    path (Path): A .json file (a list of objects) or a .csv file (with a header row).
+
+    Returns:
+    dict: Name -> normalized entry, in file order.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            rows = list(csv.DictReader(f))
+        else:
+            rows = json.load(f)
+
+    catalog = {}
+    for row in rows:
+        entry = _normalize(row, path.parent)
+        if entry["name"] in catalog:
+            raise ValueError(f"{entry['name']} is in {path.name} twice")
+        catalog[entry["name"]] = entry
+    return catalog
+
+
+def _format(value):
+    # Drop float noise and trailing zeros, 38.279999999999994 -> "38.28", 4.25 -> "4.25"
+    return f"{round(value, 4):g}"
+
+
+def can_numbers(r, h, percent_digits=2):
+    """
+    Works out every number the analysis of a can shows, as display strings.
+
+    The math is efficiency.analyze(), the scenes write S / 2π as the recurring constant.
+
+    Args:
+    r (float): Radius in cm.
+    h (float): Height in cm.
+    percent_digits (int): Decimals of the efficiency percentage.
+
+    Returns:
+    dict: d, r, h, surface (S / π), const (S / 2π), r_opt, h_opt and percent.
+    """
+    results = {name: float(value) for name, value in analyze(r, h).items()}
+    surface = results["surface"] / math.pi
+    return {
+        "d": _format(2 * r),
+        "r": _format(r),
+        "h": _format(h),
+        "surface": _format(surface),
+        "const": _format(surface / 2),
+        "r_opt": f"{results['r_opt']:.1f}",
+        "h_opt": f"{results['h_opt']:.1f}",
+        "percent": f"{results['efficiency'] * 100:.{percent_digits}f}",
+    }
+
+
+def can_scene(entry):
+    """Makes a CanAnalysis scene class for a catalog entry, named after the product."""
+    import cylinder_optimization
+
+    return type(entry["name"], (cylinder_optimization.CanAnalysis,), {
+        "can": entry,
+        "__module__": cylinder_optimization.__name__,
+    })
+
+
+def _build(entry):
+    # Runs the scene with every animation skipped and nothing written, which
+    # still builds (and so caches) every tex mobject in it
+    from manim import tempconfig
+
+    from render_all import SOURCE_FILE
+
+    options = {"input_file": str(SOURCE_FILE), "write_to_movie": False, "save_last_frame": False}
+    try:
+        with tempconfig(options):
+            can_scene(entry)(skip_animations=True).render()
+    except Exception as e:
+        return entry["name"], f"{type(e).__name__}: {e}"
+    return entry["name"], None
+
+
+def warm_cache(entries, max_workers=None):
+    """
+    Compiles the tex of the given products into the tex cache.
+
+    The first product is built on its own, so the tex every product shares is
+    compiled exactly once, then the rest are built in parallel.
+
+    Args:
+    entries (list): Catalog entries.
+    max_workers (int): Pool size, defaults to the number of cores.
+
+    Returns:
+    dict: Name -> error message, for products that failed to build.
+    """
+    from precompile import _init_worker
+
+    entries = list(entries)
+    if not entries:
+        return {}
+    max_workers = max_workers or os.cpu_count() or 1
+    failures = {}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(entries)), initializer=_init_worker) as pool:
+        results = [pool.submit(_build, entries[0]).result()]
+        results.extend(pool.map(_build, entries[1:]))
+    for name, error in results:
+        if error is not None:
+            failures[name] = error
+    return failures
+
+
+def _render_worker(entry, quality, extra_config):
+    from render_all import render_scene
+
+    start = time.perf_counter()
+    try:
+        path = render_scene(can_scene(entry), quality, extra_config)
+    except BaseException:
+        return entry["name"], False, time.perf_counter() - start, traceback.format_exc()
+    return entry["name"], True, time.perf_counter() - start, path
+
+
+def render_catalog(catalog_file=CATALOG_FILE, names=None, quality="high_quality",
+                   max_workers=None, extra_config=None):
+    """
+    Renders the analysis of every product in a catalog, in a process pool.
+
+    Args:
+    catalog_file (Path): The catalog to render.
+    names (list): Products to render, defaults to all of them.
+    quality (str): A manim quality name.
+    max_workers (int): Pool size, defaults to the number of cores.
+    extra_config (dict): Any other manim config values to render with.
+
+    Returns:
+    dict: Name -> (succeeded, seconds, movie path or traceback).
+    """
+    from manim import logger
+
+    from render_all import print_report
+
+    catalog = load_catalog(Path(catalog_file))
+    names = names or list(catalog)
+    unknown = [name for name in names if name not in catalog]
+    if unknown:
+        raise ValueError(f"Not in {Path(catalog_file).name}: {', '.join(unknown)}")
+    entries = [catalog[name] for name in names]
+
+    # Only the shared tex needs warming, every other expression is used by one product
+    failed = warm_cache(entries[:1], max_workers)
+    if failed:
+        logger.warning(f"Couldn't prebuild {entries[0]['name']}: {failed[entries[0]['name']]}")
+
+    # Workers compile their own tex concurrently, manim's cleanup would delete
+    # .dvi files out from under the others
+    options = {"no_latex_cleanup": True}
+    options.update(extra_config or {})
+
+    max_workers = max_workers or os.cpu_count() or 1
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(entries))) as pool:
+        futures = [pool.submit(_render_worker, entry, quality, options) for entry in entries]
+        for future in as_completed(futures):
+            name, ok, seconds, detail = future.result()
+            results[name] = (ok, seconds, detail)
+            print(f"{'done' if ok else 'FAILED'}: {name} ({seconds:.1f}s)", flush=True)
+
+    print_report(results, names)
+    return results
+
+
+def main(argv=None):
+    from render_all import QUALITIES
+
+    parser = argparse.ArgumentParser(description="Render the can analysis for every product in a catalog.")
+    parser.add_argument("names", nargs="*", help="Products to render (default: all)")
+    parser.add_argument("-c", "--catalog", default=str(CATALOG_FILE), help="A .json or .csv catalog")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: cores)")
+    args = parser.parse_args(argv)
+
+    results = render_catalog(args.catalog, args.names or None, QUALITIES[args.quality], args.jobs)
+    return 0 if all(ok for ok, _, _ in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
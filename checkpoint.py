@@ -0,0 +1,151 @@
+"""
+Opt-in checkpoints, so a render that dies partway through can pick up where it left off.
+
+After every play()/wait() that was actually rendered, a small checkpoint is written
+(atomically) into the scene's partial movie folder: how many animations are done,
+the renderer clock, and for each animation its partial movie file and a hash of
+the scene state coming into it (see sections.get_state_hash()).
+
+The mobject tree itself isn't pickled: updaters are mostly lambdas and closures,
+which don't pickle. Instead a restarted render runs construct() again and
+fast-forwards the finished animations with animation skipping on, which rebuilds
+every mobject and ValueTracker exactly as they were (the same thing chunk_render.py
+relies on) at the cost of no rasterization. Their partial movies are reused from
+the checkpoint, and rendering continues from the first animation that isn't in it.
+If the scene state coming into an animation doesn't match the checkpoint (the code
+changed), resuming stops there and everything after it is rendered again.
+
+The checkpoint is deleted once the scene has rendered completely.
+
+    CYLOPT_CHECKPOINT=1 manim -qh cylinder_optimization.py Salt
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from manim import config, logger
+from manim.renderer.cairo_renderer import CairoRenderer
+
+from sections import get_state_hash
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_FILE = "checkpoint.json"
+
+_installed = False
+_play = CairoRenderer.play
+_scene_finished = CairoRenderer.scene_finished
+
+
+def checkpoint_path(renderer):
+    return Path(renderer.file_writer.partial_movie_directory) / CHECKPOINT_FILE
+
+
+def _settings():
+    # Partial movies from a different resolution or format can't be reused
+    return [config.pixel_width, config.pixel_height, config.frame_rate, config.movie_file_extension]
+
+
+def load(renderer, scene):
+    """
+    Reads the checkpoint of a scene's last unfinished render.
+
+    Returns:
+    list: Animation entries ({"file", "state", "start"}) that can be reused, empty if
+        there's no usable checkpoint.
+    """
+    path = checkpoint_path(renderer)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if (data.get("version") != CHECKPOINT_VERSION or data.get("scene") != type(scene).__name__
+            or data.get("settings") != _settings()):
+        logger.info(f"Ignoring {path}, it's from a different scene or quality")
+        return []
+    # A checkpoint is written right after its movie, but check in case it was cleaned up since
+    animations = data["animations"]
+    for i, animation in enumerate(animations):
+        if animation["file"] is not None and not os.path.exists(animation["file"]):
+            return animations[:i]
+    return animations
+
+
+def save(renderer, scene, animations):
+    """Atomically writes a checkpoint covering `animations`."""
+    path = checkpoint_path(renderer)
+    data = {
+        "version": CHECKPOINT_VERSION,
+        "scene": type(scene).__name__,
+        "settings": _settings(),
+        "plays": len(animations),
+        "time": renderer.time,
+        "animations": animations,
+    }
+    # Rename over the old one, so a crash mid-write leaves the previous checkpoint intact
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _checkpointed_play(self, scene, *args, **kwargs):
+    # Nothing to resume into when no movie is being written (dry runs, cache warm-ups)
+    if not hasattr(self.file_writer, "partial_movie_directory"):
+        return _play(self, scene, *args, **kwargs)
+    if not hasattr(self, "_checkpoint"):
+        resumable = load(self, scene)
+        if resumable:
+            logger.info(f"Resuming {type(scene).__name__} after animation {len(resumable) - 1}")
+        self._checkpoint = {"resumable": resumable, "animations": []}
+    checkpoint = self._checkpoint
+
+    index = self.num_plays
+    entry = {"file": None, "state": get_state_hash(scene), "start": self.time}
+    resumable = checkpoint["resumable"]
+    if index < len(resumable):
+        if resumable[index]["state"] == entry["state"] and resumable[index]["start"] == entry["start"]:
+            # Fast-forward: skip it, then point manim at the movie rendered last time
+            original_skipping = self._original_skipping_status
+            self._original_skipping_status = True
+            try:
+                _play(self, scene, *args, **kwargs)
+            finally:
+                self._original_skipping_status = original_skipping
+            entry["file"] = resumable[index]["file"]
+            self.file_writer.partial_movie_files[-1] = entry["file"]
+            self.file_writer.sections[-1].partial_movie_files[-1] = entry["file"]
+            checkpoint["animations"].append(entry)
+            return
+        logger.info(f"Scene state changed before animation {index}, rendering the rest again")
+        checkpoint["resumable"] = []
+
+    _play(self, scene, *args, **kwargs)
+    entry["file"] = self.file_writer.partial_movie_files[-1]
+    checkpoint["animations"].append(entry)
+    # Skipped animations have no movie, the next checkpoint covers them
+    if entry["file"] is not None:
+        save(self, scene, checkpoint["animations"])
+
+
+def _checkpointed_scene_finished(self, scene):
+    _scene_finished(self, scene)
+    # Only reached when the scene rendered all the way through
+    if hasattr(self, "_checkpoint"):
+        checkpoint_path(self).unlink(missing_ok=True)
+
+
+def install():
+    """Starts checkpointing renders. Does nothing unless CYLOPT_CHECKPOINT is set."""
+    global _installed
+    if _installed or not os.environ.get("CYLOPT_CHECKPOINT"):
+        return
+    CairoRenderer.play = _checkpointed_play
+    CairoRenderer.scene_finished = _checkpointed_scene_finished
+    _installed = True
@@ -0,0 +1,168 @@
+"""
+Renders one scene across several processes by splitting its animations into chunks.
+
+A quick pass with animations skipped counts the scene's play()/wait() calls and
+their durations. The animation list is then cut into N contiguous chunks of about
+equal length, and each worker renders its chunk with manim's -n style
+from/upto animation numbers: everything before the chunk is fast-forwarded with
+animation skipping on (so the scene state is exactly what a serial render would
+have), and only the chunk itself gets rasterized. The chunk videos are stitched
+back together in order with stream copy, which gives the same frames as a serial
+render.
+
+Usage:
+    python chunk_render.py SceneName [-j WORKERS] [-q l|m|h|p|k] [-o OUTPUT]
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import QUALITIES, SOURCE_FILE, _render_worker, concat_videos
+
+
+def measure_animations(scene_name, quality="high_quality"):
+    """
+    Runs a scene with every animation skipped and records how long each one is.
+
+    Args:
+    scene_name (str): Name of the scene class in cylinder_optimization.py.
+    quality (str): A manim quality name.
+
+    Returns:
+    list: Duration in seconds of every play()/wait() call, in order.
+    """
+    from manim import tempconfig
+
+    import cylinder_optimization
+
+    options = {
+        "quality": quality,
+        "input_file": str(SOURCE_FILE),
+        "write_to_movie": False,
+        "save_last_frame": False,
+    }
+    with tempconfig(options):
+        scene = getattr(cylinder_optimization, scene_name)(skip_animations=True)
+        renderer = scene.renderer
+        durations = []
+        original_play = renderer.play
+
+        def play(scene, *args, **kwargs):
+            start = renderer.time
+            original_play(scene, *args, **kwargs)
+            durations.append(renderer.time - start)
+
+        renderer.play = play
+        scene.render()
+    return durations
+
+
+def split_chunks(durations, n):
+    """
+    Splits animations into at most n contiguous chunks of roughly equal total duration.
+
+    Args:
+    durations (list): Duration of every animation, in order.
+    n (int): Number of chunks wanted.
+
+    Returns:
+    list: (first, last) animation index pairs, inclusive, covering every animation.
+        Only a lone chunk can end at animation 0, see chunk_config().
+    """
+    # The first chunk needs at least two animations, so there's one chunk fewer than animations
+    n = max(1, min(n, len(durations) - 1))
+    total = sum(durations)
+    chunks = []
+    first = 0
+    elapsed = 0
+    for i, duration in enumerate(durations):
+        elapsed += duration
+        remaining_chunks = n - len(chunks) - 1
+        remaining_animations = len(durations) - i - 1
+        # Close the chunk once it reaches its share of the total, but always leave
+        # at least one animation for each chunk still to come
+        if i and remaining_chunks and (
+            elapsed >= total * (len(chunks) + 1) / n or remaining_animations == remaining_chunks
+        ):
+            chunks.append((first, i))
+            first = i + 1
+    if first < len(durations):
+        chunks.append((first, len(durations) - 1))
+    return chunks
+
+
+def chunk_config(scene_name, index, first, last):
+    """
+    Manim config for rendering a single chunk of a scene.
+
+    Manim ignores an upto_animation_number of 0 and renders the whole scene, which is
+    why split_chunks() never ends a chunk at animation 0 unless it's the only one.
+    """
+    return {
+        "from_animation_number": first,
+        "upto_animation_number": last,
+        "output_file": f"{scene_name}_chunk{index:03}",
+        # Every chunk gets its own partial movie folder, otherwise the workers
+        # clobber each other's partial_movie_file_list.txt and cache cleanups
+        "partial_movie_dir": f"{{video_dir}}/partial_movie_files/{{scene_name}}/chunk{index:03}",
+        "max_files_cached": 10000,
+    }
+
+
+def render_chunked(scene_name, workers=None, quality="high_quality", output=None):
+    """
+    Renders a scene in contiguous animation chunks across worker processes.
+
+    Args:
+    scene_name (str): Name of the scene class in cylinder_optimization.py.
+    workers (int): Number of chunks/processes, defaults to the number of cores.
+    quality (str): A manim quality name.
+    output (Path): Where to write the stitched video, defaults to media/chunks/<scene>.mp4.
+
+    Returns:
+    Path: The stitched video.
+    """
+    from manim import logger
+
+    workers = workers or os.cpu_count() or 1
+    output = Path(output or f"media/chunks/{scene_name}.mp4")
+
+    durations = measure_animations(scene_name, quality)
+    chunks = split_chunks(durations, workers)
+    if not chunks:
+        raise ValueError(f"{scene_name} doesn't play any animations")
+    logger.info(f"{scene_name}: {len(durations)} animations in {len(chunks)} chunks")
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        futures = [
+            pool.submit(_render_worker, scene_name, quality, chunk_config(scene_name, i, first, last))
+            for i, (first, last) in enumerate(chunks)
+        ]
+        results = [future.result() for future in futures]
+
+    failed = [(i, detail) for i, (_, ok, _, detail) in enumerate(results) if not ok]
+    if failed:
+        index, detail = failed[0]
+        raise RuntimeError(f"Chunk {index} of {scene_name} failed:\n{detail}")
+
+    concat_videos([detail for _, _, _, detail in results], output)
+    return output
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one scene in parallel chunks.")
+    parser.add_argument("scene")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of chunks (default: cores)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args(argv)
+
+    output = render_chunked(args.scene, args.jobs, QUALITIES[args.quality], args.output)
+    print(f"Wrote {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,41 @@
-from manim import *
+import os
+
+from scene_api import *
+
+import checkpoint
+import depth_sort
+import flat_spans
+import holds
+import profiling
+import tex_cache
+import text_cache
+from cans import can_numbers, load_catalog
+from derivation import VERSION as DERIVATION_VERSION, cylinder_derivation
+from images import CachedImage
+from mobjects import (
+    NumberLinePointer, ParametricFamily, PointCloud, PointerGroup, create_cylinder, create_labeled_braces,
+)
+from sections import SectionedScene
+
+# Every scene shares one on-disk LaTeX cache, see tex_cache.py
+tex_cache.install()
+# Same for Pango text (the Paragraphs), see text_cache.py
+text_cache.install()
+# Only does anything when CYLOPT_STATIC_HOLDS is set, see holds.py
+holds.install()
+# Only does anything when CYLOPT_CHECKPOINT is set, see checkpoint.py
+checkpoint.install()
+# Only does anything when CYLOPT_DEPTH_SORT is set, see depth_sort.py
+depth_sort.install()
+# Only does anything when CYLOPT_FLAT_SPANS is set, see flat_spans.py
+flat_spans.install()
+# Only does anything when CYLOPT_PROFILE is set, see profiling.py
+profiling.install()
 
 class Introduction(ThreeDScene):
     def construct(self):
         # Cylinder
-        cylinder = Cylinder(resolution=32, fill_color=BLUE, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        cylinder.rotate(PI/2, [1, 0, 0]).scale([1, 1.5, 1])
+        cylinder = create_cylinder(BLUE).scale([1, 1.5, 1])
 
         self.play(GrowFromCenter(cylinder))
         self.wait(1.5)
@@ -45,20 +75,8 @@ class Introduction(ThreeDScene):
             label_direction=DOWN,
         ).next_to(cube, DOWN, buff=1.5)
 
-        def get_surface_area_nl_pos():
-            return surface_area_nl.n2p(6 * (side_length.get_value() ** 2))
-
         # Pointer for surface area number line. What's a *pointer??
-        surface_area_arrow = LabeledArrow(
-            "S", 
-            start=get_surface_area_nl_pos() + UP * 2, 
-            end=get_surface_area_nl_pos(), 
-            label_position=0.7,
-            label_frame=False,
-            frame_fill_opacity=0,
-            max_stroke_width_to_length_ratio=0, 
-            buff=0, 
-            color=WHITE)
+        surface_area_arrow = NumberLinePointer("S", surface_area_nl, side_length, lambda s: 6 * s**2)
 
         # Number line for volume
         volume_nl = NumberLine(
@@ -67,34 +85,22 @@ class Introduction(ThreeDScene):
             label_direction=UP,
         ).next_to(surface_area_nl, DOWN, buff=1)
 
-        def get_volume_nl_pos():
-            return volume_nl.n2p(side_length.get_value() ** 3)
-
         # Arrow to show value of volume on the number line
-        volume_arrow = LabeledArrow(
-            "V", 
-            start=get_volume_nl_pos() + UP * 2, 
-            end=get_volume_nl_pos(), 
-            label_position=0.7,
-            label_frame=False,
-            frame_fill_opacity=0,
-            max_stroke_width_to_length_ratio=0, 
-            buff=0, 
-            color=WHITE)
+        volume_arrow = NumberLinePointer("V", volume_nl, side_length, lambda s: s**3)
+
+        # Both arrows follow side_length, so move them together in one shift
+        pointers = PointerGroup(surface_area_arrow, volume_arrow)
 
         # Do some setting up
         cube.set_width(side_length.get_value())
-        VGroup(cube, surface_area_nl, volume_nl, surface_area_arrow, volume_arrow).to_edge(LEFT)
+        VGroup(cube, surface_area_nl, volume_nl, pointers).to_edge(LEFT)
         self.play(
-            Create(VGroup(cube, surface_area_arrow, volume_arrow), run_time=0.5), 
+            Create(VGroup(cube, pointers), run_time=0.5), 
             DrawBorderThenFill(VGroup(surface_area_nl, volume_nl), run_time=0.5),
         )
 
         # Add updaters
-        surface_area_arrow.add_updater(lambda m: m.put_start_and_end_on(
-            get_surface_area_nl_pos() + UP * 2, get_surface_area_nl_pos()))
-        volume_arrow.add_updater(lambda m: m.put_start_and_end_on(
-            get_volume_nl_pos() + UP * 2, get_volume_nl_pos()))
+        pointers.add_updater(lambda m: m.update_positions())
         cube.add_updater(lambda m: m.set_width(side_length.get_value()))
         
         # I love hardcoding
@@ -114,9 +120,7 @@ class Introduction(ThreeDScene):
 class SquareOptimization(ThreeDScene):
     def construct(self):
         # Cylinder
-        cylinder = Cylinder(resolution=32, fill_color=BLUE, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        cylinder.rotate(PI/2, [1, 0, 0]).scale([1, 1.5, 1])
+        cylinder = create_cylinder(BLUE).scale([1, 1.5, 1])
 
         # Slap a question mark on that cylinder
         question_tex = Tex("?").scale(5).next_to(cylinder, OUT)
@@ -215,11 +219,14 @@ class SquareOptimization(ThreeDScene):
 
         p_vt = ValueTracker(4)
 
-        graph = always_redraw(lambda: axes.plot(
-            lambda l: 1 / 2 * (l * p_vt.get_value() - 2 * l**2), 
-            x_range=[0, p_vt.get_value() / 2], 
+        # Every curve for P in [4, 16] is precomputed, the updater just picks the right one
+        graph = ParametricFamily(
+            axes,
+            lambda l, p: 1 / 2 * (l * p - 2 * l**2),
+            p_range=[4, 16],
+            x_range=lambda p: (0, p / 2),
             color=WHITE)
-        )
+        graph.add_updater(lambda m: m.set_parameter(p_vt.get_value()), call_updater=True)
 
         # Numberline for constant P
         p_nl = NumberLine(
@@ -229,20 +236,8 @@ class SquareOptimization(ThreeDScene):
             color=WHITE,
         ).next_to(axes, DOWN, buff=1)
 
-        def get_p_nl_pos():
-            return p_nl.n2p(p_vt.get_value())
-
         # Arrow to show value of P on the numberline
-        arrow = LabeledArrow(
-            "P", 
-            start=get_p_nl_pos() + UP * 2, 
-            end=get_p_nl_pos(), 
-            label_position=0.7,
-            label_frame=False,
-            frame_fill_opacity=0,
-            max_stroke_width_to_length_ratio=0, 
-            buff=0, 
-            color=WHITE)
+        arrow = NumberLinePointer("P", p_nl, p_vt)
 
         # Display the graph
         self.play(
@@ -254,7 +249,7 @@ class SquareOptimization(ThreeDScene):
         )
 
         # Add an updater after drawing the arrow because it breaks stuff! Fun! (This was before I made Introduction)
-        arrow.add_updater(lambda m: m.put_start_and_end_on(get_p_nl_pos() + UP * 2, get_p_nl_pos()))
+        arrow.add_updater(lambda m: m.update_position())
 
         # Go from 16 to 4 to 9
         self.play(p_vt.animate.set_value(16), run_time=2.5)
@@ -360,9 +355,8 @@ def create_labled_brace(mobject, label, direction):
     Returns:
     VGroup: A VGroup containing the brace[0] and the label[1].
     """
-    brace = Brace(mobject, direction=direction)
-    brace_label = brace.get_tex(label)
-    return VGroup(brace, brace_label)
+    # Built from cached templates, see mobjects.create_labeled_braces()
+    return create_labeled_braces(mobject, (label, direction))[0]
 
 class CylinderPrediction(ThreeDScene):
     def construct(self):
@@ -392,9 +386,7 @@ class CylinderPrediction(ThreeDScene):
         cube = transparent_cube
 
         # Red cylinder, put inside cube
-        cylinder = Cylinder(resolution=32, fill_color=RED, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        cylinder.shift(UP * 7).rotate(PI/2, [1, 0, 0])
+        cylinder = create_cylinder(RED).shift(UP * 7)
         self.play(
             cylinder.animate.move_to(cube)
         )
@@ -410,8 +402,7 @@ class CylinderPrediction(ThreeDScene):
             MathTex("d", "=", "h"),
         ).shift(RIGHT * 3).scale(1.5)
 
-        s_group = create_labled_brace(cylinder, "s", UP * 2)
-        d_group = create_labled_brace(cylinder, "d", DOWN * 2)
+        s_group, d_group = create_labeled_braces(cylinder, ("s", UP * 2), ("d", DOWN * 2))
         self.play(Write(s_group), Write(d_group))
         self.play(Indicate(s_group[1]), Indicate(d_group[1]))
 
@@ -448,83 +439,119 @@ class CylinderPrediction(ThreeDScene):
         self.wait()
         self.play(FadeOut(cube, cylinder, s_group, d_group, h_group, d_equal_h_tex))
 
-class MiniCoke(ThreeDScene):
-    def construct(self):
-        img = ImageMobject("imgs\coke.jpg")
-        img.height = 5
+class CanAnalysis(SectionedScene, ThreeDScene):
+    """
+    How close a real can is to the most volume efficient cylinder for its surface area.
 
-        coke = Cylinder(resolution=32, fill_color=RED, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        coke.rotate(PI/2, [1, 0, 0]).scale([5.8 / 5, 10.3 / 5, 1]).to_edge(LEFT, buff=2.5)
+    Subclasses set `can` to an entry of the can catalog (see cans.py), every number
+    shown is worked out from its dimensions and every equation by derivation.py.
+    """
+    sections = ("measurement", "surface_area", "h_isolation", "derivative", "solve_h", "percent")
+    can = None
+
+    def section_inputs(self):
+        if self.can is None:
+            raise TypeError(f"{type(self).__name__} has no can, render one of its subclasses or use cans.py")
+        # The equations come from derivation.py, whose code isn't part of the section hashes
+        return tuple(sorted(self.can.items())) + (("derivation", DERIVATION_VERSION),)
+
+    def pause(self, narrated=1, brisk=1):
+        """Waits `narrated` seconds for voiced-over products and `brisk` seconds for the rest, 0 doesn't wait."""
+        duration = narrated if self.can["narrated"] else brisk
+        if duration:
+            self.wait(duration)
+
+    def measurement(self):
+        numbers = can_numbers(self.can["r"], self.can["h"], self.can["percent_digits"])
+        scale = self.can["display_scale"]
+
+        cylinder = create_cylinder(RED).scale([2 * self.can["r"] * scale, self.can["h"] * scale, 1]).to_edge(LEFT, buff=2.5)
+
+        if self.can["image"] is None:
+            self.play(GrowFromCenter(cylinder))
+        elif self.can["narrated"]:
+            img = CachedImage(self.can["image"], height=5)
+
+            self.play(FadeIn(img))
+            self.wait(5)
+            self.play(
+                img.animate.to_edge(RIGHT, buff=2.5),
+                GrowFromCenter(cylinder)
+            )
+            self.wait()
+            self.play(FadeOut(img))
+        else:
+            img = CachedImage(self.can["image"], height=5)
+            img.to_edge(RIGHT, buff=2.5)
 
-        self.play(FadeIn(img))
-        self.wait(5)
-        self.play(
-            img.animate.to_edge(RIGHT, buff=2.5),
-            GrowFromCenter(coke)
-        )
-        self.wait()
-        self.play(FadeOut(img))
+            self.play(FadeIn(img))
+            self.wait()
+            self.play(GrowFromCenter(cylinder))
+            self.wait()
+            self.play(FadeOut(img))
 
-        r = 2.9
-        h = 10.3
-        coke_tex = VGroup(
-            MathTex("d", "=", R"5.8\text{ cm}"),
+        r = numbers["r"]
+        h = numbers["h"]
+        can_tex = VGroup(
+            MathTex("d", "=", Rf"{numbers['d']}\text{{ cm}}"),
             MathTex("r", "=", Rf"{r}\text{{ cm}}"),
             MathTex("h", "=", Rf"{h}\text{{ cm}}")
         ).shift(RIGHT * 3).scale(1.5)
 
-        d_group = create_labled_brace(coke, "d", DOWN * 2)
+        # Both at once, the cylinder doesn't move in between
+        d_group, h_group = create_labeled_braces(cylinder, ("d", DOWN * 2), ("h", RIGHT * 2))
         self.play(Write(d_group))
-        self.play(Write(coke_tex[0]))
+        self.pause(0)
+        self.play(Write(can_tex[0]))
+        self.pause(0)
 
-        coke_tex[1].move_to(coke_tex[0]).shift(DOWN * 0.5),
-        self.play(coke_tex[0].animate.shift(UP * 0.5))
-        self.play(Write(coke_tex[1]))
+        can_tex[1].move_to(can_tex[0]).shift(DOWN * 0.5),
+        self.play(can_tex[0].animate.shift(UP * 0.5))
+        self.play(Write(can_tex[1]))
         self.wait()
 
-        h_group = create_labled_brace(coke, "h", RIGHT * 2)
         self.play(Write(h_group))
+        self.pause(0)
 
-        coke_tex[2].move_to(coke_tex[1]).shift(DOWN * 0.5),
-        self.play(Group(coke_tex[0], coke_tex[1]).animate.shift(UP * 0.5))
-        self.play(Write(coke_tex[2]))
+        can_tex[2].move_to(can_tex[1]).shift(DOWN * 0.5),
+        self.play(Group(can_tex[0], can_tex[1]).animate.shift(UP * 0.5))
+        self.play(Write(can_tex[2]))
         self.wait()
 
         info_tex = VGroup(
-            coke_tex[1],
-            coke_tex[2]
+            can_tex[1],
+            can_tex[2]
         )
 
         self.play(
-            FadeOut(VGroup(coke, d_group, h_group, coke_tex[0])),
+            FadeOut(VGroup(cylinder, d_group, h_group, can_tex[0])),
             info_tex.animate.scale(0.5).arrange(DOWN, aligned_edge=LEFT).to_corner(UP + LEFT), 
         )
-        self.wait(2)
+        self.pause(2)
 
-        formulas = VGroup(
-            MathTex("V", "=", R"\pi", "r^2", "h"),
-            MathTex("S", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2")
-        ).shift(UP).arrange(DOWN * 1.5).scale(1.5)
+        self.numbers, self.info_tex = numbers, info_tex
+        self.steps = cylinder_derivation(r, h)
+
+    def surface_area(self):
+        steps, info_tex = self.steps, self.info_tex
+
+        formulas = VGroup(*(MathTex(*tex) for tex in steps["formulas"])).shift(UP).arrange(DOWN * 1.5).scale(1.5)
 
         self.play(Write(formulas))
         self.wait()
 
-        self.play(Circumscribe(formulas[0]))
-        self.wait(3)
-        self.play(Circumscribe(formulas[1]))
-        self.wait(3)
+        if self.can["narrated"]:
+            self.play(Circumscribe(formulas[0]))
+            self.wait(3)
+            self.play(Circumscribe(formulas[1]))
+            self.wait(3)
 
         self.play(
             formulas.animate.scale(0.5).arrange(DOWN, aligned_edge=LEFT).next_to(info_tex, DOWN).to_edge(LEFT)
         )
         self.wait()
 
-        surface_tex = VGroup(
-            MathTex("S", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2"),
-            MathTex("=", R"2\pi", Rf"\left({r}\right)", Rf"\left({h}\right)", "+", R"2\pi", Rf"\left({r}\right)^2"),
-            MathTex("=", R"77.56\pi", R"\text{ cm}^2")
-        ).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
+        surface_tex = VGroup(*(MathTex(*tex) for tex in steps["surface_tex"])).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
 
         surface_tex[1].align_to(surface_tex[0][1], LEFT)
         surface_tex[2].align_to(surface_tex[0][1], LEFT)
@@ -536,274 +563,14 @@ class MiniCoke(ThreeDScene):
         self.wait()
 
         self.play(Write(surface_tex[2]))
-        self.wait(3)
-
-        # Recurring constant
-        const = "38.78"
-        h_tex = VGroup(
-            MathTex(R"77.56\pi", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2"),
-            MathTex(Rf"{const}\pi", "=", "r", "h", "+", "r^2"),
-            MathTex(Rf"\frac{{{const}-r^2}}{{r}}", "=", "h")
-        ).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
-
-        h_tex[0].move_to(surface_tex[0]).align_to(surface_tex[0], RIGHT)
-
-        self.play(
-            ReplacementTransform(surface_tex[0][1:].copy(), h_tex[0][1:], run_time=0.1),
-            ReplacementTransform(surface_tex[2][1].copy(), h_tex[0][0]),
-            FadeOut(surface_tex))
-        self.wait()
-
-        self.play(Write(h_tex[1:]))
-        self.wait()
-
-        temp_tex = MathTex("h", "=", Rf"\frac{{{const}-r^2}}{{r}}").scale(0.75).to_corner(DOWN + LEFT)
-        self.play(TransformMatchingTex(h_tex[2], temp_tex))
-        h_tex[2] = temp_tex
-
-        v_tex = VGroup(
-            MathTex("V", "=", R"\pi", "r^2", "h"),
-            MathTex("V", "=", R"\pi", "r^2", R"\left(", Rf"\frac{{{const}-r^2}}{{r}}", R"\right)"),
-            MathTex("=", Rf"\pi{const}r", "-", R"\pi{r^3}")
-        ).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
-
-        v_tex[1].align_to(v_tex[0], LEFT).shift(DOWN * 0.1)
-        v_tex[2].next_to(v_tex[1], DOWN).align_to(v_tex[1][1], LEFT)
-
-        self.play(
-            FadeOut(h_tex[:2]),
-        )
-        self.play(Write(v_tex[0]))
-        self.wait()
-
-        self.play(
-            TransformMatchingShapes(v_tex[0], v_tex[1][:4]),
-            ReplacementTransform(h_tex[2][2].copy(), v_tex[1][4:])
-        )
-        self.wait()
-
-        self.play(Write(v_tex[2]))
-        self.wait()
-
-        self.play(
-            v_tex[2].animate.next_to(v_tex[1][0], RIGHT, buff=0.2).align_to(v_tex[1][0], DOWN),
-            FadeOut(v_tex[1][1:]),
-        )
-        self.wait(3)
-
-        dv_tex = VGroup(
-            MathTex(R"\frac{dV}{dr}", "=", R"\frac{d}{dr}", R"\left[", Rf"{const}{{\pi}}r", "-", R"\pi{r^3}", R"\left]"),
-            MathTex(R"\frac{dV}{dr}", "=", Rf"{const}\pi", "-", R"3{\pi}r^2"),
-            MathTex("0", "=", Rf"{const}\pi", "-", R"3{\pi}r^2"),
-            MathTex("r", "=", Rf"\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}", "=", "3.6", R"\text{ cm}"), # Brackets lmao
-        ).move_to(v_tex[1]).arrange(DOWN)
-
-        self.play(
-            ReplacementTransform(VGroup(v_tex[1][0], v_tex[2][0]), dv_tex[0][:3]),
-            FadeIn(dv_tex[0][3], dv_tex[0][7]),
-            ReplacementTransform(v_tex[2][1:], dv_tex[0][4:7])
-        )
-        self.wait()
-
-        self.play(ReplacementTransform(dv_tex[0].copy(), dv_tex[1]))
-        self.wait()
-        self.play(ReplacementTransform(dv_tex[1].copy(), dv_tex[2]))
-        self.wait()
-        self.play(ReplacementTransform(dv_tex[2].copy(), dv_tex[3]))
-        self.wait(5)
-
-        temp_tex = MathTex("r", "=", Rf"\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}").scale(0.75).next_to(h_tex[2], UP).to_edge(LEFT)
-        self.play(
-            FadeOut(dv_tex[:3], v_tex[1][0]),
-            ReplacementTransform(dv_tex[3][:4], temp_tex),
-            FadeOut(dv_tex[3][4:])
-        )
-        self.wait(5)
-        dv_tex[3] = temp_tex
+        self.pause(3)
 
-        modify_r_tex = VGroup(
-            MathTex("r", "=", R"\sqrt{", f"{const}", R"\over3", "}"),
-            MathTex("r^2", "=", R"\sqrt{", f"{const}", R"\over3", "}^2"),
-            MathTex("r^2", "=", "{", f"{const}", R"\over", "3", "}"),
-            MathTex("3", "r^2", "=", f"{const}")
-        )
+        self.formulas, self.surface_tex = formulas, surface_tex
 
-        solve_h_tex = VGroup(
-            MathTex("h", "=", "{", f"{const}", "-r^2" R"\over{r}}"),
-            MathTex("h", "=", "{", "3r^2", "-r^2" + R"\over{r}}"),
-            MathTex("h", "=", R"\frac{2r^2}{r}"),
-            MathTex("h", "=", "2r"),
-            MathTex("h", "=", Rf"2\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}", "=", "7.2", R"\text{ cm}")
-        )
+    def h_isolation(self):
+        steps, surface_tex = self.steps, self.surface_tex
 
-        self.play(
-            TransformMatchingTex(h_tex[2].copy(), solve_h_tex[0].shift(UP)),
-            TransformMatchingTex(dv_tex[3].copy(), modify_r_tex[0].next_to(solve_h_tex[0], DOWN, buff=0.5))
-        )
-        self.wait(7)
-        modify_r_tex[1:].next_to(solve_h_tex[0], DOWN, buff=0.5)
-
-        self.play(
-            Indicate(modify_r_tex[0][3]),
-            Indicate(solve_h_tex[0][3])
-        )
-        self.wait(5)
-
-        self.play(TransformMatchingTex(modify_r_tex[0], modify_r_tex[1]))
-        self.wait()
-        self.play(TransformMatchingTex(modify_r_tex[1], modify_r_tex[2]))
-        self.wait()
-        self.play(TransformMatchingTex(modify_r_tex[2], modify_r_tex[3]))
-        self.wait()
-
-        solve_h_tex[1].move_to(solve_h_tex[0])
-        self.play(
-            ReplacementTransform(modify_r_tex[3][:2].copy(), solve_h_tex[1][3]),
-            TransformMatchingShapes(solve_h_tex[0][:2], solve_h_tex[1][:3]),
-            TransformMatchingShapes(solve_h_tex[0][4:], solve_h_tex[1][4:]),
-            FadeOut(solve_h_tex[0][3], modify_r_tex[3]),
-        )
-        self.wait()
-
-        solve_h_tex[2:].arrange(DOWN).shift(DOWN * 0.5)
-        self.play(
-            solve_h_tex[1].animate.next_to(solve_h_tex[2], UP),
-            Write(solve_h_tex[2])
-        )
-        self.wait()
-        self.play(Write(solve_h_tex[3]))
-        self.wait()
-        self.play(Write(solve_h_tex[4]))
-        self.wait(4)
-
-        temp_tex = MathTex("h", "=", Rf"2\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}").scale(0.75).to_corner(DOWN + LEFT)
-        self.play(
-            FadeOut(solve_h_tex[1:4]),
-            FadeOut(h_tex[2]),
-            dv_tex[3].animate.next_to(temp_tex, UP).to_edge(LEFT),
-            ReplacementTransform(solve_h_tex[4][:4], temp_tex),
-            FadeOut(solve_h_tex[4][4:])
-        )
-        self.wait(3)
-        solve_h_tex[4] = temp_tex
-
-        percent_tex = VGroup(
-            MathTex(R"{\text{Actual Volume of Cylinder}}", R"\over", R"{\text{Maximum Possible Volume of Cylinder}}"),
-            MathTex("{", Rf"\pi\left({r}\right)^2\left({h}\right)", R"\over", 
-                    Rf"\pi\left(\sqrt{{\frac{{{const}}}{3}}}\right)^2\left(2\sqrt{{\frac{{{const}}}{3}}}\right)", "}"),
-        )
-
-        self.play(Write(percent_tex[0]))
-        self.wait(3)
-        self.play(FadeTransform(percent_tex[0], percent_tex[1]))
-        self.wait()
-
-        temp_tex = MathTex(
-            R"{", Rf"\pi\left({r}\right)^2\left({h}\right)", R"\over", 
-            Rf"\pi\left(\sqrt{{\frac{{{const}}}{3}}}\right)^2\left(2\sqrt{{\frac{{{const}}}{3}}}\right)", "}",
-            R"=93.19\%"
-        )
-        self.play(TransformMatchingTex(percent_tex[1], temp_tex))
-        self.wait(3)
-        percent_tex[1] = temp_tex
-        self.play(FadeOut(percent_tex[1], info_tex, formulas, dv_tex[3], solve_h_tex[4]))
-        self.wait()
-
-class Salt(ThreeDScene):
-    def construct(self):
-        img = ImageMobject("imgs\salt.jpg")
-        img.height = 5
-        img.to_edge(RIGHT, buff=2.5)
-
-        salt = Cylinder(resolution=32, fill_color=RED, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        salt.rotate(PI/2, [1, 0, 0]).scale([8.5 / 6, 13.5 / 6, 1]).to_edge(LEFT, buff=2.5)
-
-        self.play(FadeIn(img))
-        self.wait()
-        self.play(GrowFromCenter(salt))
-        self.wait()
-        self.play(FadeOut(img))
-
-        r = 4.25
-        h = 13.5
-        salt_tex = VGroup(
-            MathTex("d", "=", R"8.5\text{ cm}"),
-            MathTex("r", "=", Rf"{r}\text{{ cm}}"),
-            MathTex("h", "=", Rf"{h}\text{{ cm}}")
-        ).shift(RIGHT * 3).scale(1.5)
-
-        d_group = create_labled_brace(salt, "d", DOWN * 2)
-        self.play(Write(d_group))
-        self.wait()
-        
-        self.play(Write(salt_tex[0]))
-
-        self.wait()
-
-        salt_tex[1].move_to(salt_tex[0]).shift(DOWN * 0.5),
-        self.play(salt_tex[0].animate.shift(UP * 0.5))
-        self.play(Write(salt_tex[1]))
-        self.wait()
-
-        h_group = create_labled_brace(salt, "h", RIGHT * 2)
-        self.play(Write(h_group))
-        self.wait()
-
-        salt_tex[2].move_to(salt_tex[1]).shift(DOWN * 0.5),
-        self.play(Group(salt_tex[0], salt_tex[1]).animate.shift(UP * 0.5))
-        self.play(Write(salt_tex[2]))
-        self.wait()
-
-        info_tex = VGroup(
-            salt_tex[1],
-            salt_tex[2]
-        )
-
-        self.play(
-            FadeOut(VGroup(salt, d_group, h_group, salt_tex[0])),
-            info_tex.animate.scale(0.5).arrange(DOWN, aligned_edge=LEFT).to_corner(UP + LEFT), 
-        )
-        self.wait()
-
-        formulas = VGroup(
-            MathTex("V", "=", R"\pi", "r^2", "h"),
-            MathTex("S", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2")
-        ).shift(UP).arrange(DOWN * 1.5).scale(1.5)
-
-        self.play(Write(formulas))
-        self.wait()
-
-        self.play(
-            formulas.animate.scale(0.5).arrange(DOWN, aligned_edge=LEFT).next_to(info_tex, DOWN).to_edge(LEFT)
-        )
-        self.wait()
-
-        surface_tex = VGroup(
-            MathTex("S", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2"),
-            MathTex("=", R"2\pi", Rf"\left({r}\right)", Rf"\left({h}\right)", "+", R"2\pi", Rf"\left({r}\right)^2"),
-            MathTex("=", R"150.875\pi", R"\text{ cm}^2")
-        ).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
-
-        surface_tex[1].align_to(surface_tex[0][1], LEFT)
-        surface_tex[2].align_to(surface_tex[0][1], LEFT)
-
-        self.play(Write(surface_tex[0]))
-        self.wait()
-
-        self.play(Write(surface_tex[1]))
-        self.wait()
-
-        self.play(Write(surface_tex[2]))
-        self.wait()
-
-        # Recurring constant
-        const = "75.4375"
-        h_tex = VGroup(
-            MathTex(R"150.875\pi", "=", R"2\pi", "r", "h", "+", R"2\pi", "r^2"),
-            MathTex(Rf"{const}\pi", "=", "r", "h", "+", "r^2"),
-            MathTex(Rf"\frac{{{const}-r^2}}{{r}}", "=", "h")
-        ).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
+        h_tex = VGroup(*(MathTex(*tex) for tex in steps["h_tex"])).arrange(DOWN).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
 
         h_tex[0].move_to(surface_tex[0]).align_to(surface_tex[0], RIGHT)
 
@@ -816,15 +583,16 @@ class Salt(ThreeDScene):
         self.play(Write(h_tex[1:]))
         self.wait()
 
-        temp_tex = MathTex("h", "=", Rf"\frac{{{const}-r^2}}{{r}}").scale(0.75).to_corner(DOWN + LEFT)
+        temp_tex = MathTex(*steps["h_temp"]).scale(0.75).to_corner(DOWN + LEFT)
         self.play(TransformMatchingTex(h_tex[2], temp_tex))
         h_tex[2] = temp_tex
 
-        v_tex = VGroup(
-            MathTex("V", "=", R"\pi", "r^2", "h"),
-            MathTex("V", "=", R"\pi", "r^2", R"\left(", Rf"\frac{{{const}-r^2}}{{r}}", R"\right)"),
-            MathTex("=", Rf"\pi{const}r", "-", R"\pi{r^3}")
-        ).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
+        self.h_tex = h_tex
+
+    def derivative(self):
+        steps, h_tex = self.steps, self.h_tex
+
+        v_tex = VGroup(*(MathTex(*tex) for tex in steps["v_tex"])).to_corner(UP + LEFT).shift(RIGHT * 4).shift(DOWN * 2)
 
         v_tex[1].align_to(v_tex[0], LEFT).shift(DOWN * 0.1)
         v_tex[2].next_to(v_tex[1], DOWN).align_to(v_tex[1][1], LEFT)
@@ -848,14 +616,9 @@ class Salt(ThreeDScene):
             v_tex[2].animate.next_to(v_tex[1][0], RIGHT, buff=0.2).align_to(v_tex[1][0], DOWN),
             FadeOut(v_tex[1][1:]),
         )
-        self.wait()
+        self.pause(3)
 
-        dv_tex = VGroup(
-            MathTex(R"\frac{dV}{dr}", "=", R"\frac{d}{dr}", R"\left[", Rf"{const}{{\pi}}r", "-", R"\pi{r^3}", R"\left]"),
-            MathTex(R"\frac{dV}{dr}", "=", Rf"{const}\pi", "-", R"3{\pi}r^2"),
-            MathTex("0", "=", Rf"{const}\pi", "-", R"3{\pi}r^2"),
-            MathTex("r", "=", Rf"\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}", "=", "5.0", R"\text{ cm}"), # Brackets lmao
-        ).move_to(v_tex[1]).arrange(DOWN)
+        dv_tex = VGroup(*(MathTex(*tex) for tex in steps["dv_tex"])).move_to(v_tex[1]).arrange(DOWN)
 
         self.play(
             ReplacementTransform(VGroup(v_tex[1][0], v_tex[2][0]), dv_tex[0][:3]),
@@ -869,44 +632,37 @@ class Salt(ThreeDScene):
         self.play(ReplacementTransform(dv_tex[1].copy(), dv_tex[2]))
         self.wait()
         self.play(ReplacementTransform(dv_tex[2].copy(), dv_tex[3]))
-        self.wait()
+        self.pause(5)
 
-        temp_tex = MathTex("r", "=", Rf"\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}").scale(0.75).next_to(h_tex[2], UP).to_edge(LEFT)
+        temp_tex = MathTex(*steps["r_temp"]).scale(0.75).next_to(h_tex[2], UP).to_edge(LEFT)
         self.play(
             FadeOut(dv_tex[:3], v_tex[1][0]),
             ReplacementTransform(dv_tex[3][:4], temp_tex),
             FadeOut(dv_tex[3][4:])
         )
-        self.wait()
+        self.pause(5)
         dv_tex[3] = temp_tex
 
-        modify_r_tex = VGroup(
-            MathTex("r", "=", R"\sqrt{", f"{const}", R"\over3", "}"),
-            MathTex("r^2", "=", R"\sqrt{", f"{const}", R"\over3", "}^2"),
-            MathTex("r^2", "=", "{", f"{const}", R"\over", "3", "}"),
-            MathTex("3", "r^2", "=", f"{const}")
-        )
+        self.dv_tex = dv_tex
 
-        solve_h_tex = VGroup(
-            MathTex("h", "=", "{", f"{const}", "-r^2" R"\over{r}}"),
-            MathTex("h", "=", "{", "3r^2", "-r^2" + R"\over{r}}"),
-            MathTex("h", "=", R"\frac{2r^2}{r}"),
-            MathTex("h", "=", "2r"),
-            MathTex("h", "=", Rf"2\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}", "=", "10.0", R"\text{ cm}")
-        )
+    def solve_h(self):
+        steps, h_tex, dv_tex = self.steps, self.h_tex, self.dv_tex
+
+        modify_r_tex = VGroup(*(MathTex(*tex) for tex in steps["modify_r_tex"]))
+        solve_h_tex = VGroup(*(MathTex(*tex) for tex in steps["solve_h_tex"]))
 
         self.play(
             TransformMatchingTex(h_tex[2].copy(), solve_h_tex[0].shift(UP)),
             TransformMatchingTex(dv_tex[3].copy(), modify_r_tex[0].next_to(solve_h_tex[0], DOWN, buff=0.5))
         )
-        self.wait()
+        self.pause(7)
         modify_r_tex[1:].next_to(solve_h_tex[0], DOWN, buff=0.5)
 
         self.play(
             Indicate(modify_r_tex[0][3]),
             Indicate(solve_h_tex[0][3])
         )
-        self.wait()
+        self.pause(5)
 
         self.play(TransformMatchingTex(modify_r_tex[0], modify_r_tex[1]))
         self.wait()
@@ -933,9 +689,9 @@ class Salt(ThreeDScene):
         self.play(Write(solve_h_tex[3]))
         self.wait()
         self.play(Write(solve_h_tex[4]))
-        self.wait()
+        self.pause(4)
 
-        temp_tex = MathTex("h", "=", Rf"2\sqrt{{\frac{{{const}}}{3}}}", R"\text{ cm}").scale(0.75).to_corner(DOWN + LEFT)
+        temp_tex = MathTex(*steps["h_opt_temp"]).scale(0.75).to_corner(DOWN + LEFT)
         self.play(
             FadeOut(solve_h_tex[1:4]),
             FadeOut(h_tex[2]),
@@ -943,29 +699,37 @@ class Salt(ThreeDScene):
             ReplacementTransform(solve_h_tex[4][:4], temp_tex),
             FadeOut(solve_h_tex[4][4:])
         )
-        self.wait()
+        self.pause(3)
         solve_h_tex[4] = temp_tex
 
+        self.solve_h_tex = solve_h_tex
+
+    def percent(self):
+        numbers, steps = self.numbers, self.steps
+        info_tex, formulas, dv_tex, solve_h_tex = self.info_tex, self.formulas, self.dv_tex, self.solve_h_tex
+
         percent_tex = VGroup(
             MathTex(R"{\text{Actual Volume of Cylinder}}", R"\over", R"{\text{Maximum Possible Volume of Cylinder}}"),
-            MathTex("{", Rf"\pi\left({r}\right)^2\left({h}\right)", R"\over", 
-                    Rf"\pi\left(\sqrt{{\frac{{{const}}}{3}}}\right)^2\left(2\sqrt{{\frac{{{const}}}{3}}}\right)", "}"),
+            MathTex(*steps["percent_tex"]),
         )
 
         self.play(Write(percent_tex[0]))
-        self.wait()
+        self.pause(3)
         self.play(FadeTransform(percent_tex[0], percent_tex[1]))
         self.wait()
 
-        temp_tex = MathTex(
-            R"{", Rf"\pi\left({r}\right)^2\left({h}\right)", R"\over", 
-            Rf"\pi\left(\sqrt{{\frac{{{const}}}{3}}}\right)^2\left(2\sqrt{{\frac{{{const}}}{3}}}\right)", "}",
-            R"=96.7\%"
-        )
+        temp_tex = MathTex(*steps["percent_tex"], Rf"={numbers['percent']}\%")
         self.play(TransformMatchingTex(percent_tex[1], temp_tex))
         self.wait(3)
         percent_tex[1] = temp_tex
         self.play(FadeOut(percent_tex[1], info_tex, formulas, dv_tex[3], solve_h_tex[4]))
+        self.pause(1, 0)
+
+class MiniCoke(CanAnalysis):
+    can = load_catalog()["MiniCoke"]
+
+class Salt(CanAnalysis):
+    can = load_catalog()["Salt"]
 
 class Proof(ThreeDScene):
     def construct(self):
@@ -1147,9 +911,7 @@ class Proof(ThreeDScene):
         self.play(Create(cube))
         self.wait(0.5)
 
-        cylinder = Cylinder(resolution=32, fill_color=RED, checkerboard_colors=False, 
-        fill_opacity=0.5, stroke_width=0, show_ends=True)
-        cylinder.shift(UP * 7).rotate(PI/2, [1, 0, 0])
+        cylinder = create_cylinder(RED).shift(UP * 7)
         self.play(cylinder.animate.move_to(cube))
         self.wait(2)
 
@@ -1180,3 +942,240 @@ class ConcludingQuestion(Scene):
             self.wait(24)
 
             self.play(FadeOut(question_tex, answer_tex))
+
+class ToleranceDistribution(Scene):
+    # Which can and its ± manufacturing tolerances in cm, see tolerance.py
+    can_name = "MiniCoke"
+    r_tolerance = 0.05
+    h_tolerance = 0.1
+    samples = 1_000_000
+    # Simulated cans drawn as points, the percentiles use all of them
+    shown = 20_000
+    columns = 60
+
+    def construct(self):
+        from tolerance import simulate
+
+        can = load_catalog()[self.can_name]
+        result = simulate(can["r"], can["h"], self.r_tolerance, self.h_tolerance, self.samples, keep=self.shown, seed=0)
+        efficiency = 100 * result["sample"]
+
+        # ±4σ around the mean, rounded out to 0.05%
+        half_width = max(np.ceil(400 * result["std"] / 0.05) * 0.05, 0.05)
+        center = np.round(100 * result["mean"] / 0.05) * 0.05
+        x_min, x_max = center - half_width, center + half_width
+
+        axes = Axes(
+            x_range=[x_min, x_max, half_width / 2],
+            y_range=[0, 1, 1],
+            x_length=10,
+            y_length=5,
+            tips=False,
+            x_axis_config={"include_numbers": True, "decimal_number_config": {"num_decimal_places": 2}},
+            y_axis_config={"include_ticks": False},
+        ).shift(DOWN * 0.5)
+        x_label = axes.get_x_axis_label(MathTex(R"\text{Efficiency }(\%)"), edge=DOWN, direction=DOWN, buff=0.6)
+        title = Tex(Rf"{self.can_name}: $\pm{self.r_tolerance:g}$ cm on $r$, $\pm{self.h_tolerance:g}$ cm on $h$").to_edge(UP)
+
+        # Stack the points into columns, each one at its real efficiency
+        efficiency = efficiency[(efficiency >= x_min) & (efficiency <= x_max)]
+        column = np.minimum(((efficiency - x_min) / (x_max - x_min) * self.columns).astype(int), self.columns - 1)
+        order = np.argsort(column, kind="stable")
+        starts = np.searchsorted(column[order], np.arange(self.columns))
+        height = np.empty(len(column), dtype=int)
+        height[order] = np.arange(len(column)) - starts[column[order]]
+
+        origin = axes.c2p(x_min, 0)
+        x_unit = (axes.c2p(x_max, 0) - origin) / (x_max - x_min)
+        step = axes.y_length / (height.max() + 1)
+        points = origin + np.outer(efficiency - x_min, x_unit) + np.outer(height + 0.5, UP * step)
+
+        t = ((efficiency - x_min) / (x_max - x_min))[:, None]
+        colors = (1 - t) * color_to_rgba(BLUE) + t * color_to_rgba(YELLOW)
+        cloud = PointCloud(points, colors, stroke_width=1.5, count=0)
+
+        self.play(Write(title), Create(axes), Write(x_label))
+        self.wait()
+
+        revealed = ValueTracker(0)
+        cloud.add_updater(lambda m: m.set_count(revealed.get_value()))
+        self.add(cloud)
+        self.play(revealed.animate.set_value(len(points)), run_time=6, rate_func=linear)
+        cloud.clear_updaters()
+        self.wait()
+
+        markers = VGroup()
+        for q in (5, 50, 95):
+            x = 100 * result["percentiles"][q]
+            line = DashedLine(axes.c2p(x, 0), axes.c2p(x, 1), color=WHITE)
+            label = MathTex(Rf"p_{{{q}}}={x:.2f}\%").scale(0.5).next_to(line, UP, buff=0.1)
+            markers.add(VGroup(line, label))
+        self.play(LaggedStart(*[Create(marker) for marker in markers], lag_ratio=0.5))
+        self.wait()
+
+        summary = MathTex(
+            Rf"\text{{{result['samples']:,} simulated cans: }}",
+            Rf"{100 * result['mean']:.2f}\% \pm {100 * result['std']:.2f}\%"
+        ).scale(0.75).next_to(title, DOWN)
+        self.play(Write(summary))
+        self.wait(3)
+
+        self.play(FadeOut(title, axes, x_label, cloud, markers, summary))
+
+class EfficiencyFrontier(Scene):
+    # CSV or Parquet file of real can dimensions (r and h columns in cm, any others are ignored). Without
+    # one, a random sample of plausible cans is plotted instead
+    data_file = os.environ.get("CYLOPT_CAN_DATA")
+    sample_size = 5000
+    # Rows read from the data per batch, they're pulled in as the animation needs them
+    chunk_rows = 256
+    grow_time = 6
+
+    def stream_cans(self):
+        """Yields (r, h, efficiency) arrays, a chunk at a time."""
+        from efficiency import analyze, analyze_file
+
+        if self.data_file:
+            for r, h, results in analyze_file(self.data_file, self.chunk_rows):
+                yield r, h, results["efficiency"]
+            return
+
+        rng = np.random.default_rng(0)
+        r = rng.uniform(1.5, 6, self.sample_size)
+        h = r * rng.lognormal(np.log(2.5), 0.4, self.sample_size)
+        for i in range(0, self.sample_size, self.chunk_rows):
+            chunk_r, chunk_h = r[i:i + self.chunk_rows], h[i:i + self.chunk_rows]
+            yield chunk_r, chunk_h, analyze(chunk_r, chunk_h)["efficiency"]
+
+    def count_cans(self):
+        from efficiency import count_rows
+
+        if not self.data_file:
+            return self.sample_size
+        return count_rows(self.data_file)
+
+    def construct(self):
+        x_max, y_max = 8, 20
+        axes = Axes(
+            x_range=[0, x_max, 1],
+            y_range=[0, y_max, 2],
+            x_length=6,
+            y_length=6,
+            tips=False,
+            axis_config={"include_numbers": True},
+        ).to_edge(LEFT, buff=1)
+        labels = axes.get_axis_labels(MathTex(R"r\text{ (cm)}"), MathTex(R"h\text{ (cm)}"))
+
+        optimal = axes.plot(lambda r: 2 * r, x_range=[0, y_max / 2], color=WHITE)
+        optimal_label = MathTex("h=2r").next_to(axes.c2p(y_max / 2 - 1, y_max - 2), LEFT)
+
+        title = Tex("Real cans vs. the optimal cylinder").to_edge(UP)
+        source = Tex("sample data" if not self.data_file else os.path.basename(self.data_file)).scale(0.5).next_to(title, DOWN)
+        legend = VGroup(
+            Tex(R"efficiency"),
+            Tex(R"50\%", color=RED),
+            Tex(R"75\%", color=YELLOW),
+            Tex(R"100\%", color=GREEN),
+        ).arrange(DOWN, aligned_edge=LEFT).scale(0.7).to_edge(RIGHT, buff=1.5)
+
+        self.play(Write(title), Write(source), Create(axes), Write(labels))
+        self.play(Create(optimal), Write(optimal_label))
+        self.wait()
+
+        # Graph coordinates to scene coordinates in one affine step, for whole chunks at once
+        origin = axes.c2p(0, 0)
+        x_unit = axes.c2p(1, 0) - origin
+        y_unit = axes.c2p(0, 1) - origin
+        red, yellow, green = (color_to_rgba(color) for color in (RED, YELLOW, GREEN))
+
+        cloud = PointCloud(stroke_width=2)
+        chunks = self.stream_cans()
+        rows_read = 0
+
+        def pull(m, target):
+            nonlocal rows_read
+            while rows_read < target:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                r, h, efficiency = chunk
+                rows_read += len(r)
+                inside = (r <= x_max) & (h <= y_max)
+                r, h, efficiency = r[inside], h[inside], efficiency[inside]
+                # Red at 50% (or less) through yellow at 75% to green at 100%
+                t = np.clip((efficiency - 0.5) / 0.5, 0, 1)[:, None]
+                colors = np.where(t < 0.5, red + (yellow - red) * 2 * t, yellow + (green - yellow) * (2 * t - 1))
+                m.extend(origin + np.outer(r, x_unit) + np.outer(h, y_unit), colors)
+
+        total = self.count_cans()
+        streamed = ValueTracker(0)
+        cloud.add_updater(lambda m: pull(m, streamed.get_value()))
+        self.add(cloud)
+        self.play(streamed.animate.set_value(total), FadeIn(legend), run_time=self.grow_time, rate_func=linear)
+        cloud.clear_updaters()
+        self.wait()
+
+        # The cans from the earlier scenes
+        highlights = VGroup()
+        for name, can in load_catalog().items():
+            dot = Dot(axes.c2p(can["r"], can["h"]), color=WHITE, radius=0.06)
+            highlights.add(VGroup(dot, Tex(name).scale(0.5).next_to(dot, RIGHT, buff=0.1)))
+        self.play(LaggedStart(*[FadeIn(highlight) for highlight in highlights], lag_ratio=0.5))
+        self.wait(3)
+
+        self.play(FadeOut(title, source, axes, labels, optimal, optimal_label, legend, cloud, highlights))
+
+class ShapeOptimization(ThreeDScene):
+    # Any shape in shapes.SHAPES, and the surface area it gets
+    shape_name = "cone"
+    surface = 24
+
+    def construct(self):
+        from shapes import SHAPES, solve
+
+        shape = SHAPES[self.shape_name]
+        best = solve(shape, self.surface)
+        x_best, x_max = float(best["x"]), float(shape.x_max(self.surface))
+
+        # A too-narrow and a too-wide shape with the same surface area, then the best one
+        too_wide = x_best + 0.7 * (x_max - x_best) if x_max - x_best > 1e-6 * x_max else 0.8 * x_best
+        candidates = [(x, float(shape.height(x, self.surface))) for x in (0.5 * x_best, too_wide, x_best)]
+        scale = 5 / max(max(shape.total_height(x, y), shape.width(x)) for x, y in candidates)
+
+        def build(x, y):
+            return shape.build(x, y, BLUE).scale(scale).to_edge(LEFT, buff=3)
+
+        def volume_tex(x, y):
+            return MathTex("V", "=", f"{shape.volume(x, y):.2f}").scale(1.5).shift(RIGHT * 3)
+
+        title = Tex(Rf"{self.shape_name.replace('_', ' ').capitalize()}, $S={self.surface:g}$").to_edge(UP)
+        self.play(Write(title))
+
+        solid = build(*candidates[0])
+        volume = volume_tex(*candidates[0])
+        self.play(GrowFromCenter(solid), Write(volume))
+        self.wait()
+
+        for x, y in candidates[1:]:
+            self.play(Transform(solid, build(x, y)), Transform(volume, volume_tex(x, y)))
+            self.wait()
+
+        self.play(Circumscribe(volume))
+        self.wait()
+
+        width_group, height_group = create_labeled_braces(
+            solid, (shape.width_label, DOWN * 2), (shape.y_label, RIGHT * 2)
+        )
+        self.play(Write(width_group), Write(height_group))
+        self.wait()
+
+        if shape.optimum_tex is not None:
+            optimum_tex = MathTex(shape.optimum_tex)
+        else:
+            optimum_tex = MathTex(Rf"{shape.y_label}\approx{float(best['ratio']):.3f}{shape.width_label}")
+        optimum_tex.scale(1.5).next_to(volume, DOWN, buff=1)
+        self.play(Write(optimum_tex))
+        self.play(Circumscribe(optimum_tex))
+        self.wait(2)
+
+        self.play(FadeOut(title, solid, volume, width_group, height_group, optimum_tex))
@@ -0,0 +1,116 @@
+"""
+Opt-in reuse of the 3D depth sort while the camera stands still.
+
+With the Cairo renderer, ThreeDCamera sorts every 3D face by its distance to the
+camera on every frame: one get_center() (a pass over the face's points) per face,
+hundreds of faces for a Cylinder. None of the scenes move the camera, and most of
+the time the cubes and cylinders just sit there while the tex next to them changes.
+
+With this installed, the depth of each 3D mobject's faces is remembered per scene
+mobject, along with the camera's rotation matrix and a hash of the mobject's
+points. The hash is one pass over the points in C instead of a Python call per
+face, and while it and the camera stay the same the remembered depths are reused.
+The final sort is still done over everything on screen with manim's own key, so
+the drawing order (and so every pixel) is the same as without it.
+
+Set CYLOPT_DEPTH_SORT to enable it:
+
+    CYLOPT_DEPTH_SORT=1 manim -qh cylinder_optimization.py CylinderPrediction
+
+The number of re-sorts skipped is counted for every frame and summed up on exit.
+"""
+import atexit
+import hashlib
+import os
+
+import numpy as np
+from manim import logger
+from manim.camera.camera import Camera
+from manim.camera.three_d_camera import ThreeDCamera
+
+frames = 0
+# Scene mobjects whose face depths were reused / computed again, over all frames
+skipped = 0
+resorted = 0
+# Same, for the last frame drawn
+frame_skipped = 0
+
+_installed = False
+
+
+def _is_3d(mob):
+    return getattr(mob, "shade_in_3d", False)
+
+
+def _fingerprint(family):
+    """Hash of everything the depths of a mobject's faces depend on, besides the camera."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for mob in family:
+        hasher.update(np.ascontiguousarray(mob.points))
+        hasher.update(b"\x01" if _is_3d(mob) else b"\x00")
+    return hasher.digest()
+
+
+def _depths(family, rot_matrix):
+    # Same as ThreeDCamera.get_mobjects_to_display's z_key
+    return {
+        id(mob): np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        for mob in family if _is_3d(mob) and mob.has_points()
+    }
+
+
+def sorted_mobjects_to_display(self, mobjects, *args, **kwargs):
+    """Replacement for ThreeDCamera.get_mobjects_to_display reusing the depths of unchanged mobjects."""
+    global frames, skipped, resorted, frame_skipped
+
+    displayed = Camera.get_mobjects_to_display(self, mobjects, *args, **kwargs)
+    rot_matrix = self.get_rotation_matrix()
+    camera_key = rot_matrix.tobytes()
+    cache = getattr(self, "_depth_cache", {})
+
+    depths = {}
+    new_cache = {}
+    frame_skipped = 0
+    for mobject in mobjects:
+        family = mobject.get_family()
+        # A z_index_group makes the depth depend on some other mobject, don't bother
+        if not any(map(_is_3d, family)) or any(hasattr(mob, "z_index_group") for mob in family):
+            continue
+        fingerprint = _fingerprint(family)
+        entry = cache.get(id(mobject))
+        if entry is not None and entry[0] is mobject and entry[1] == camera_key and entry[2] == fingerprint:
+            frame_skipped += 1
+        else:
+            entry = (mobject, camera_key, fingerprint, _depths(family, rot_matrix))
+            resorted += 1
+        new_cache[id(mobject)] = entry
+        depths.update(entry[3])
+    self._depth_cache = new_cache
+    frames += 1
+    skipped += frame_skipped
+
+    def z_key(mob):
+        if not _is_3d(mob):
+            return np.inf
+        depth = depths.get(id(mob))
+        if depth is None:
+            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+        return depth
+
+    return sorted(displayed, key=z_key)
+
+
+def report():
+    if frames:
+        logger.info(f"Depth sort: {skipped} re-sorts skipped, {resorted} done over {frames} frames "
+                    f"({skipped / frames:.1f} skipped per frame)")
+
+
+def install():
+    """Starts reusing depth sorts. Does nothing unless CYLOPT_DEPTH_SORT is set."""
+    global _installed
+    if _installed or not os.environ.get("CYLOPT_DEPTH_SORT"):
+        return
+    ThreeDCamera.get_mobjects_to_display = sorted_mobjects_to_display
+    atexit.register(report)
+    _installed = True
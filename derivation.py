@@ -0,0 +1,271 @@
+"""
+Generates the algebra steps of the can analysis, and the MathTex splits for them.
+
+The surface area and volume formulas are kept as polynomials in r with exact
+(Fraction) coefficients: S = A(r)h + B(r) and V = C(r)h, everything in units of π.
+From those the derivation is worked out, not typed in:
+    - the constant: S / π divided by the common factor of A and B,
+    - isolate h: h = (constant - B(r)) / A(r),
+    - substitute into V and expand,
+    - differentiate, and solve dV/dr = 0 for r,
+    - put the constant back in terms of r to get h in terms of r.
+Each step is rendered as lists of tex substrings, split the way the CanAnalysis
+animations index into them.
+
+Results are memoized on disk (see disk_cache.py) by the can's dimensions, so the
+derivation for a can that was already seen is a single file read.
+"""
+import json
+import math
+from fractions import Fraction
+
+from disk_cache import DiskCache
+
+# Bump when the generated steps change, so old cache entries aren't used
+VERSION = 1
+
+derivation_cache = DiskCache("derivations", max_mb=16)
+
+
+class Polynomial:
+    """
+    A (Laurent) polynomial in one variable with exact coefficients.
+
+    Args:
+    terms (dict): Power -> coefficient.
+    """
+
+    def __init__(self, terms=None):
+        self.terms = {power: Fraction(c) for power, c in (terms or {}).items() if c != 0}
+
+    def __add__(self, other):
+        terms = dict(self.terms)
+        for power, c in other.terms.items():
+            terms[power] = terms.get(power, 0) + c
+        return Polynomial(terms)
+
+    def __neg__(self):
+        return Polynomial({power: -c for power, c in self.terms.items()})
+
+    def __sub__(self, other):
+        return self + -other
+
+    def __mul__(self, other):
+        if not isinstance(other, Polynomial):
+            return Polynomial({power: c * Fraction(other) for power, c in self.terms.items()})
+        terms = {}
+        for p1, c1 in self.terms.items():
+            for p2, c2 in other.terms.items():
+                terms[p1 + p2] = terms.get(p1 + p2, 0) + c1 * c2
+        return Polynomial(terms)
+
+    def __truediv__(self, other):
+        if not isinstance(other, Polynomial):
+            return self * (1 / Fraction(other))
+        if len(other.terms) != 1:
+            raise ValueError("Can only divide by a single term")
+        (power, c), = other.terms.items()
+        return Polynomial({p - power: c1 / c for p, c1 in self.terms.items()})
+
+    def __eq__(self, other):
+        return isinstance(other, Polynomial) and self.terms == other.terms
+
+    def __call__(self, x):
+        return sum(c * Fraction(x) ** power for power, c in self.terms.items())
+
+    def derivative(self):
+        return Polynomial({power - 1: c * power for power, c in self.terms.items() if power})
+
+    def content(self):
+        """The largest number dividing every coefficient (as a Fraction)."""
+        numerators = math.gcd(*(c.numerator for c in self.terms.values()))
+        denominators = math.lcm(*(c.denominator for c in self.terms.values()))
+        return Fraction(numerators, denominators)
+
+    def ordered(self):
+        """(power, coefficient) pairs, lowest power first, the way the scenes write them (38.28 - r^2)."""
+        return sorted(self.terms.items())
+
+
+def number_tex(value):
+    """A Fraction as a decimal, exact if it terminates, 4 places otherwise."""
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+    return f"{float(value):.4f}".rstrip("0").rstrip(".")
+
+
+def power_tex(variable, power):
+    return variable if power == 1 else f"{variable}^{power}"
+
+
+def coefficient_tex(c, unit=""):
+    """A coefficient in front of a variable, 1 is left out."""
+    return unit if c == 1 else f"{number_tex(c)}{unit}"
+
+
+def term_tex(c, power, variable="r", unit=""):
+    """One term without its sign, e.g. 3\\pi r^2 (a coefficient of 1 is left out)."""
+    c = abs(c)
+    if not power:
+        return coefficient_tex(c, unit) or "1"
+    coefficient = coefficient_tex(c, unit)
+    # The space keeps \pi from running into the variable
+    separator = " " if unit and coefficient else ""
+    return f"{coefficient}{separator}{power_tex(variable, power)}"
+
+
+def polynomial_parts(poly, variable="r", unit=""):
+    """A polynomial as split substrings: ["38.28\\pi r", "-", "\\pi r^3"]."""
+    parts = []
+    for i, (power, c) in enumerate(poly.ordered()):
+        term = term_tex(c, power, variable, unit)
+        if i:
+            parts += ["-" if c < 0 else "+", term]
+        else:
+            parts.append(f"-{term}" if c < 0 else term)
+    return parts
+
+
+def polynomial_tex(poly, variable="r", unit=""):
+    return "".join(polynomial_parts(poly, variable, unit))
+
+
+def solve_two_terms(poly):
+    """
+    Solves a x^m + b x^n = 0 (m > n) for x^(m - n).
+
+    Returns:
+    tuple: (m - n, numerator, denominator), x^(m - n) = numerator / denominator. Left
+        unsimplified for display, only the sign is moved to the numerator.
+    """
+    if len(poly.terms) != 2:
+        raise ValueError("Only two-term equations can be solved")
+    (n, b), (m, a) = sorted(poly.terms.items())
+    if a < 0:
+        return m - n, b, -a
+    return m - n, -b, a
+
+
+# S = 2πrh + 2πr² and V = πr²h, in units of π, as A(r)h + B(r) and C(r)h
+AREA_H = Polynomial({1: 2})
+AREA_REST = Polynomial({2: 2})
+VOLUME_H = Polynomial({2: 1})
+
+
+def _cylinder_derivation(r, h):
+    r_value, h_value = Fraction(r), Fraction(h)
+    r_text, h_text = number_tex(r_value), number_tex(h_value)
+    pi = R"\pi"
+    cm = R"\text{ cm}"
+
+    # S / π, and the recurring constant: S / π over the common factor of A and B
+    surface_value = AREA_H(r_value) * h_value + AREA_REST(r_value)
+    surface = number_tex(surface_value)
+    factor = (AREA_H + AREA_REST).content()
+    const = surface_value / factor
+    area_h, area_rest = AREA_H / factor, AREA_REST / factor
+    c = number_tex(const)
+
+    # h = (const - B(r)) / A(r)
+    h_numerator = Polynomial({0: const}) - area_rest
+    h_fraction = Rf"\frac{{{polynomial_tex(h_numerator)}}}{{{polynomial_tex(area_h)}}}"
+
+    # V = C(r) h(r), expanded and differentiated, dV/dr = 0 solved for r^2
+    volume_in_r = VOLUME_H * h_numerator / area_h
+    volume = polynomial_parts(volume_in_r, unit=pi)
+    slope = volume_in_r.derivative()
+    power, numerator, denominator = solve_two_terms(slope)
+    if power != 2 or numerator != const:
+        raise ValueError("dV/dr = 0 doesn't give r^2 as a fraction of the constant")
+    d = number_tex(denominator)
+    r_root = Rf"\sqrt{{\frac{{{c}}}{{{d}}}}}"
+    r_opt = math.sqrt(numerator / denominator)
+
+    # Writing the constant as d r^2 turns h into a multiple of r
+    const_in_r = Polynomial({2: denominator})
+    h_in_r = (const_in_r - area_rest) / area_h
+    (_, ratio), = h_in_r.terms.items()
+    h_root = f"{number_tex(ratio)}{r_root}"
+    h_opt = float(ratio) * r_opt
+
+    # The formula cards keep each variable its own part, so they can be indicated on their own
+    area = [coefficient_tex(AREA_H.terms[1], pi), "r", "h", "+", coefficient_tex(AREA_REST.terms[2], pi), "r^2"]
+    reduced_area = [coefficient_tex(area_h.terms[1]), "r", "h", "+", coefficient_tex(area_rest.terms[2]), "r^2"]
+    # A coefficient of 1 leaves an empty part, MathTex would render that as a space
+    reduced_area = [part for part in reduced_area if part]
+    volume_card = [pi, "r^2", "h"]
+    h_over = f"-{polynomial_tex(area_rest)}" + Rf"\over{{{polynomial_tex(area_h)}}}}}"
+
+    return {
+        "const": c,
+        "surface": surface,
+        "formulas": [
+            ["V", "="] + volume_card,
+            ["S", "="] + area,
+        ],
+        "surface_tex": [
+            ["S", "="] + area,
+            ["=", area[0], Rf"\left({r_text}\right)", Rf"\left({h_text}\right)", "+", area[4], Rf"\left({r_text}\right)^2"],
+            ["=", f"{surface}{pi}", R"\text{ cm}^2"],
+        ],
+        "h_tex": [
+            [f"{surface}{pi}", "="] + area,
+            [c, "="] + reduced_area,
+            [h_fraction, "=", "h"],
+        ],
+        "h_temp": ["h", "=", h_fraction],
+        "v_tex": [
+            ["V", "="] + volume_card,
+            ["V", "=", pi, "r^2", R"\left(", h_fraction, R"\right)"],
+            ["="] + volume,
+        ],
+        "dv_tex": [
+            # \left] is on purpose, MathTex turns unbalanced delimiters into \big ones
+            [R"\frac{dV}{dr}", "=", R"\frac{d}{dr}", R"\left["] + volume + [R"\left]"],
+            [R"\frac{dV}{dr}", "="] + polynomial_parts(slope, unit=pi),
+            ["0", "="] + polynomial_parts(slope, unit=pi),
+            ["r", "=", r_root, cm, "=", f"{r_opt:.1f}", cm],
+        ],
+        "r_temp": ["r", "=", r_root, cm],
+        "modify_r_tex": [
+            ["r", "=", R"\sqrt{", c, Rf"\over{d}", "}"],
+            ["r^2", "=", R"\sqrt{", c, Rf"\over{d}", "}^2"],
+            ["r^2", "=", "{", c, R"\over", d, "}"],
+            [d, "r^2", "=", c],
+        ],
+        "solve_h_tex": [
+            ["h", "=", "{", c, h_over],
+            ["h", "=", "{", polynomial_tex(const_in_r), h_over],
+            ["h", "=", Rf"\frac{{{polynomial_tex(const_in_r - area_rest)}}}{{{polynomial_tex(area_h)}}}"],
+            ["h", "=", polynomial_tex(h_in_r)],
+            ["h", "=", h_root, cm, "=", f"{h_opt:.1f}", cm],
+        ],
+        "h_opt_temp": ["h", "=", h_root, cm],
+        "percent_tex": [
+            "{", Rf"{pi}\left({r_text}\right)^2\left({h_text}\right)", R"\over",
+            Rf"{pi}\left({r_root}\right)^2\left({h_root}\right)", "}",
+        ],
+    }
+
+
+def cylinder_derivation(r, h):
+    """
+    The steps of maximizing a cylinder's volume for the surface area of an r by h can.
+
+    Args:
+    r (str): Radius, as shown (a decimal string, so the arithmetic stays exact).
+    h (str): Height, as shown.
+
+    Returns:
+    dict: Step name -> list of MathTex argument lists (or one list), plus the
+        "const" and "surface" strings.
+    """
+    key = derivation_cache.key("cylinder", VERSION, str(r), str(h))
+    cached = derivation_cache.get(key, ".json")
+    if cached is not None:
+        return json.loads(cached.read_text(encoding="utf-8"))
+
+    steps = _cylinder_derivation(r, h)
+    derivation_cache.put_bytes(key, ".json", json.dumps(steps).encode("utf-8"))
+    return steps
@@ -0,0 +1,140 @@
+"""
+Tiny content-addressed disk cache shared by the render helpers.
+
+Entries are plain files named after a hash of whatever produced them, so they can
+be shared between scenes, processes and machines that mount the same directory.
+The cache is bounded: once it grows past its size limit the least recently used
+files (by mtime, which gets bumped on every hit) are deleted.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from manim import logger
+
+# Bump this if the layout of anything stored in here changes
+CACHE_VERSION = 1
+
+CACHE_ROOT = Path(os.environ.get(
+    "CYLOPT_CACHE_DIR",
+    Path.home() / ".cache" / "cylinder_optimization"))
+
+
+class DiskCache:
+    """
+    A directory of cached files with LRU eviction and hit/miss counters.
+
+    Args:
+    name (str): Name of the cache, also the name of its directory under CACHE_ROOT.
+    max_mb (float): Size limit in megabytes. Can be overridden with the
+        CYLOPT_<NAME>_CACHE_MB environment variable.
+    """
+
+    def __init__(self, name, max_mb=256):
+        self.name = name
+        self.directory = CACHE_ROOT / name
+        max_mb = float(os.environ.get(f"CYLOPT_{name.upper()}_CACHE_MB", max_mb))
+        self.max_bytes = int(max_mb * 1024 ** 2)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts):
+        """
+        Hashes the given parts into a cache key.
+
+        Args:
+        *parts: Anything with a stable repr (strings, numbers, tuples...).
+
+        Returns:
+        str: A hex digest identifying the entry.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(repr((CACHE_VERSION,) + parts).encode())
+        return hasher.hexdigest()
+
+    def path(self, key, suffix):
+        return self.directory / (key + suffix)
+
+    def get(self, key, suffix):
+        """
+        Looks up an entry, counting the hit or miss.
+
+        Returns:
+        Path: Path of the cached file, or None if it isn't cached.
+        """
+        path = self.path(key, suffix)
+        try:
+            # Bumping the mtime is what makes the eviction LRU instead of FIFO
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put_bytes(self, key, suffix, data):
+        """Atomically stores raw bytes as an entry and returns its path."""
+        return self._put(key, suffix, lambda f: f.write(data))
+
+    def put_file(self, key, suffix, source):
+        """Atomically copies an existing file into the cache and returns its path."""
+        with open(source, "rb") as src:
+            return self._put(key, suffix, lambda f: shutil.copyfileobj(src, f))
+
+    def put_with(self, key, suffix, write):
+        """
+        Atomically stores an entry produced by a writer callback.
+
+        Args:
+        write (Callable): Called with a binary file object to write the entry into
+            (np.savez and friends work fine).
+
+        Returns:
+        Path: Path of the stored entry.
+        """
+        return self._put(key, suffix, write)
+
+    def _put(self, key, suffix, write):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(key, suffix)
+        # Write next to the final file and rename, so other processes never see half an entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        self.evict()
+        return path
+
+    def evict(self):
+        """Deletes least recently used entries until the cache fits in its size limit."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if not entry.is_file() or entry.name.endswith(".tmp"):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+            except OSError:
+                # Someone else evicted it first
+                continue
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def report(self):
+        logger.info(f"{self.name} cache: {self.hits} hits, {self.misses} misses")
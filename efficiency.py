@@ -0,0 +1,189 @@
+"""
+Volume efficiency of cylindrical cans, vectorized over any number of them.
+
+For a can of radius r and height h:
+    S = 2πrh + 2πr²                 its surface area,
+    r* = sqrt(S / 6π), h* = 2r*     the cylinder with the most volume for that surface,
+    V* = πr*²h*                     that maximum volume,
+    efficiency = πr²h / V*          how much of it the real can gets.
+analyze() does this for whole arrays of (r, h) at once, in float64 or float32.
+Files too big for memory are streamed in fixed-size chunks, from CSV (with a
+header row, any extra columns are ignored) or, if pyarrow is installed, Parquet.
+
+Usage:
+    python efficiency.py cans.csv [--chunk-rows N] [--float32] [-o results.csv]
+"""
+import argparse
+import csv
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+FIELDS = ("surface", "r_opt", "h_opt", "volume", "max_volume", "efficiency")
+
+
+def analyze(r, h, dtype=np.float64):
+    """
+    Works out the volume efficiency of every can.
+
+    Args:
+    r (np.ndarray): Radii, any shape (or a scalar).
+    h (np.ndarray): Heights, broadcastable against r.
+    dtype (np.dtype): float64, or float32 to halve the memory.
+
+    Returns:
+    dict: surface, r_opt, h_opt, volume, max_volume and efficiency arrays (0 to 1),
+        all of the broadcast shape of r and h.
+    """
+    dtype = np.dtype(dtype)
+    r = np.asarray(r, dtype=dtype)
+    h = np.asarray(h, dtype=dtype)
+    pi = dtype.type(np.pi)
+
+    # S / 2π = rh + r², which is all the optimum depends on
+    half_surface = r * (h + r)
+    r_opt = np.sqrt(half_surface / 3)
+    h_opt = 2 * r_opt
+
+    # Out of place first, h may broadcast r to a bigger shape
+    volume = r * r * h
+    volume *= pi
+    # πr*²h* = 2πr*³
+    max_volume = r_opt ** 3
+    max_volume *= 2 * pi
+
+    surface = half_surface
+    surface *= 2 * pi
+    return {
+        "surface": surface,
+        "r_opt": r_opt,
+        "h_opt": h_opt,
+        "volume": volume,
+        "max_volume": max_volume,
+        "efficiency": volume / max_volume,
+    }
+
+
+def _read_header(path, r_column, h_column):
+    with open(path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f))
+    header = [name.strip() for name in header]
+    missing = [name for name in (r_column, h_column) if name not in header]
+    if missing:
+        raise ValueError(f"{Path(path).name} has no {', '.join(missing)} column")
+    return header.index(r_column), header.index(h_column)
+
+
+def iter_csv(path, chunk_rows=1_000_000, r_column="r", h_column="h", dtype=np.float64):
+    """
+    Reads the r and h columns of a CSV file in chunks.
+
+    Args:
+    path (Path): CSV file with a header row.
+    chunk_rows (int): Rows per chunk, which bounds the memory used.
+    r_column (str): Name of the radius column.
+    h_column (str): Name of the height column.
+    dtype (np.dtype): Type of the returned arrays.
+
+    Yields:
+    tuple: (r, h) arrays of up to chunk_rows values each.
+    """
+    columns = _read_header(path, r_column, h_column)
+    with open(path, encoding="utf-8") as f:
+        next(f)
+        while True:
+            lines = list(itertools.islice(f, chunk_rows))
+            if not lines:
+                return
+            # loadtxt parses in C, handing it the lines keeps the chunking in our hands
+            data = np.loadtxt(lines, delimiter=",", usecols=columns, dtype=dtype, ndmin=2)
+            yield data[:, 0], data[:, 1]
+
+
+def iter_parquet(path, chunk_rows=1_000_000, r_column="r", h_column="h", dtype=np.float64):
+    """Same as iter_csv(), for Parquet files. Needs pyarrow."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet files needs pyarrow, pip install pyarrow") from None
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=[r_column, h_column]):
+        yield (
+            batch.column(0).to_numpy(zero_copy_only=False).astype(dtype, copy=False),
+            batch.column(1).to_numpy(zero_copy_only=False).astype(dtype, copy=False),
+        )
+
+
+def analyze_file(path, chunk_rows=1_000_000, r_column="r", h_column="h", dtype=np.float64):
+    """
+    Streams a CSV or Parquet file of can dimensions through analyze(), chunk by chunk.
+
+    Yields:
+    tuple: (r, h, results) for every chunk, results as returned by analyze().
+    """
+    reader = iter_parquet if Path(path).suffix.lower() == ".parquet" else iter_csv
+    for r, h in reader(path, chunk_rows, r_column, h_column, dtype):
+        yield r, h, analyze(r, h, dtype)
+
+
+def count_rows(path, chunk_rows=1_000_000, r_column="r", h_column="h"):
+    """
+    Number of cans analyze_file() will yield for a file.
+
+    Parquet files have it in their metadata. CSVs are read through iter_csv(), so
+    blank lines count the same way they do when streaming.
+    """
+    if Path(path).suffix.lower() == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading Parquet files needs pyarrow, pip install pyarrow") from None
+        return pq.ParquetFile(path).metadata.num_rows
+    return sum(len(r) for r, _ in iter_csv(path, chunk_rows, r_column, h_column))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Volume efficiency of every can in a CSV/Parquet file.")
+    parser.add_argument("file")
+    parser.add_argument("--chunk-rows", type=int, default=1_000_000)
+    parser.add_argument("--r-column", default="r")
+    parser.add_argument("--h-column", default="h")
+    parser.add_argument("--float32", action="store_true", help="Compute in single precision")
+    parser.add_argument("-o", "--output", default=None, help="Write every can's results to this CSV")
+    args = parser.parse_args(argv)
+
+    dtype = np.float32 if args.float32 else np.float64
+    output = open(args.output, "w") if args.output else None
+    count = 0
+    total = 0.0
+    worst = np.inf
+    best = -np.inf
+    try:
+        if output is not None:
+            output.write(",".join(("r", "h") + FIELDS) + "\n")
+        for r, h, results in analyze_file(args.file, args.chunk_rows, args.r_column, args.h_column, dtype):
+            efficiency = results["efficiency"]
+            count += len(efficiency)
+            # Accumulate in float64 whatever the chunks are in
+            total += efficiency.sum(dtype=np.float64)
+            if len(efficiency):
+                worst = min(worst, efficiency.min())
+                best = max(best, efficiency.max())
+            if output is not None:
+                np.savetxt(output, np.column_stack([r, h] + [results[field] for field in FIELDS]),
+                           delimiter=",", fmt="%.6g")
+    finally:
+        if output is not None:
+            output.close()
+
+    if not count:
+        print("No cans")
+        return 1
+    print(f"{count} cans, efficiency mean {total / count:.2%}, min {worst:.2%}, max {best:.2%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
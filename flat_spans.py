@@ -0,0 +1,105 @@
+"""
+Opt-in 2D drawing of the flat stretches of 3D scenes.
+
+Every scene is a ThreeDScene, but most of SquareOptimization, MiniCoke, Salt and
+Proof is flat tex, axes and number lines. ThreeDCamera still projects every one of
+their points through the camera's rotation and perspective on every frame, and
+asks every one of them for its shading, which with the default camera (looking
+straight down, unzoomed, centered) leaves flat points exactly where they were.
+
+With this installed, every frame is classified before it's drawn. It's flat when
+the camera has its default orientation, zoom and center, and every mobject being
+drawn has all its points at z = 0, no 3D shading, and no fixed orientation. Flat
+frames are drawn with the plain 2D Camera's methods, which skip the projection,
+sorting and shading; everything else goes through ThreeDCamera as usual. On a flat
+frame the 3D versions of those methods would return exactly what the 2D ones do,
+so the output is pixel-identical, only cheaper to get.
+
+Set CYLOPT_FLAT_SPANS to enable it:
+
+    CYLOPT_FLAT_SPANS=1 manim -qh cylinder_optimization.py Proof
+
+How many frames (and runs of consecutive frames) went through each path is logged
+on exit.
+"""
+import atexit
+import os
+
+import numpy as np
+from manim import logger
+from manim.camera.camera import Camera
+from manim.camera.three_d_camera import ThreeDCamera
+from manim.utils.family import extract_mobject_family_members
+
+# ThreeDCamera's overrides of Camera that flat frames go without
+OVERRIDES = ("get_mobjects_to_display", "transform_points_pre_display", "get_fill_rgbas", "get_stroke_rgbas")
+
+flat_frames = 0
+frames_3d = 0
+# Runs of consecutive flat frames
+flat_spans = 0
+
+_installed = False
+_last_flat = False
+
+
+def default_view(camera):
+    """Whether the camera leaves points at z = 0 exactly where they are."""
+    return (
+        np.array_equal(camera.get_rotation_matrix(), np.identity(3))
+        and camera.get_zoom() == 1
+        and camera.get_focal_distance() > 0
+        and not camera.frame_center.any()
+    )
+
+
+def is_flat(camera, mobjects):
+    """Whether none of the mobjects (or their submobjects) need anything ThreeDCamera does."""
+    for mob in extract_mobject_family_members(mobjects, only_those_with_points=True):
+        if getattr(mob, "shade_in_3d", False) or mob in camera.fixed_orientation_mobjects:
+            return False
+        if mob.points[:, 2].any():
+            return False
+    return True
+
+
+def capture_mobjects(self, mobjects, **kwargs):
+    """Replacement for ThreeDCamera.capture_mobjects that draws flat frames in 2D."""
+    global flat_frames, frames_3d, flat_spans, _last_flat
+
+    self.reset_rotation_matrix()
+    flat = default_view(self) and is_flat(self, mobjects)
+    if flat:
+        flat_frames += 1
+        flat_spans += not _last_flat
+    else:
+        frames_3d += 1
+    _last_flat = flat
+    if not flat:
+        Camera.capture_mobjects(self, mobjects, **kwargs)
+        return
+
+    # Shadow the 3D methods on the instance for this one frame
+    for name in OVERRIDES:
+        setattr(self, name, getattr(Camera, name).__get__(self))
+    try:
+        Camera.capture_mobjects(self, mobjects, **kwargs)
+    finally:
+        for name in OVERRIDES:
+            delattr(self, name)
+
+
+def report():
+    if flat_frames or frames_3d:
+        logger.info(f"Flat spans: {flat_frames} of {flat_frames + frames_3d} frames drawn in 2D, "
+                    f"in {flat_spans} spans")
+
+
+def install():
+    """Starts drawing flat frames in 2D. Does nothing unless CYLOPT_FLAT_SPANS is set."""
+    global _installed
+    if _installed or not os.environ.get("CYLOPT_FLAT_SPANS"):
+        return
+    ThreeDCamera.capture_mobjects = capture_mobjects
+    atexit.register(report)
+    _installed = True
@@ -0,0 +1,175 @@
+"""
+Opt-in fast path for static holds.
+
+A long self.wait() is one frame repeated: at 60 fps the 24 second hold in
+ConcludingQuestion is 1440 identical 8 MB frames piped through ffmpeg. With this
+installed, every animation's frames are compared against its first frame as they
+come in, and the ffmpeg pipe is only opened once one differs. If none do (a hold,
+whether manim froze the frame itself or an updater redrew the same pixels every
+time), the frame is written to disk once and ffmpeg loops it into the partial movie:
+
+    ffmpeg -stream_loop N-1 -f rawvideo ... -i frame.rgba -frames:v N partial.mp4
+
+so the cost of a hold no longer depends on piping its length. The loop segment is
+encoded with the same codec settings as manim's pipe, since the partial movies get
+stitched together with a stream copy (which is also why these aren't true
+variable-frame-rate segments: copying needs every segment on the same frame timing).
+
+Set CYLOPT_STATIC_HOLDS to enable it, to a number to change the shortest hold
+(in frames) that gets looped instead of piped:
+
+    CYLOPT_STATIC_HOLDS=1 manim -qh cylinder_optimization.py ConcludingQuestion
+"""
+import atexit
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from manim import __version__, config, logger
+from manim.constants import RendererType
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import is_webm_format, write_to_movie
+
+# Shorter holds are cheaper to pipe than to start another ffmpeg for
+MIN_HOLD_FRAMES = 30
+
+min_hold_frames = MIN_HOLD_FRAMES
+holds = 0
+held_frames = 0
+_installed = False
+
+_begin_animation = SceneFileWriter.begin_animation
+_end_animation = SceneFileWriter.end_animation
+_write_frame = SceneFileWriter.write_frame
+
+
+def _codec_args():
+    # The same choices SceneFileWriter.open_movie_pipe() makes
+    if is_webm_format():
+        return ["-vcodec", "libvpx-vp9", "-auto-alt-ref", "0"]
+    if config["transparent"]:
+        return ["-vcodec", "qtrle"]
+    return ["-vcodec", "libx264", "-pix_fmt", "yuv420p"]
+
+
+def encode_hold(frame, count, file_path):
+    """
+    Writes a partial movie of `count` copies of one frame, looped by ffmpeg.
+
+    Args:
+    frame (np.ndarray): The RGBA frame, as the Cairo renderer produces it.
+    count (int): Number of frames the hold lasts.
+    file_path (Path): The partial movie file to write.
+    """
+    fps = config["frame_rate"]
+    if fps == int(fps):
+        fps = int(fps)
+    height, width = frame.shape[:2]
+
+    fd, frame_path = tempfile.mkstemp(dir=Path(file_path).parent, suffix=".rgba")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(frame.tobytes())
+        command = [
+            config.ffmpeg_executable,
+            "-y",
+            "-stream_loop", str(count - 1),
+            "-f", "rawvideo",
+            "-s", f"{width}x{height}",
+            "-pix_fmt", "rgba",
+            "-r", str(fps),
+            "-i", frame_path,
+            "-frames:v", str(count),
+            "-an",
+            "-loglevel", config["ffmpeg_loglevel"].lower(),
+            "-metadata", f"comment=Rendered with Manim Community v{__version__}",
+        ] + _codec_args() + [str(file_path)]
+        subprocess.run(command, check=True)
+    finally:
+        os.unlink(frame_path)
+
+
+def _held_begin_animation(self, allow_write=False, file_path=None):
+    if not (write_to_movie() and allow_write) or config.renderer != RendererType.CAIRO:
+        return _begin_animation(self, allow_write, file_path)
+    # Don't open the pipe yet, the first frames decide whether it's needed
+    self._hold = {"file_path": file_path, "frame": None, "count": 0}
+
+
+def _held_write_frame(self, frame_or_renderer):
+    hold = getattr(self, "_hold", None)
+    if hold is None:
+        return _write_frame(self, frame_or_renderer)
+
+    frame = frame_or_renderer
+    if hold["frame"] is None:
+        hold["frame"] = frame
+    # freeze_current_frame() passes the same array over and over, which skips the compare
+    if frame is hold["frame"] or np.array_equal(frame, hold["frame"]):
+        hold["count"] += 1
+        return
+
+    # It moves after all, catch the pipe up and stream the rest as usual
+    self._hold = None
+    self.open_movie_pipe(file_path=hold["file_path"])
+    for _ in range(hold["count"]):
+        _write_frame(self, hold["frame"])
+    _write_frame(self, frame)
+
+
+def _held_end_animation(self, allow_write=False):
+    global holds, held_frames
+
+    hold = getattr(self, "_hold", None)
+    if hold is None:
+        return _end_animation(self, allow_write)
+    self._hold = None
+
+    if hold["count"] < min_hold_frames:
+        self.open_movie_pipe(file_path=hold["file_path"])
+        for _ in range(hold["count"]):
+            _write_frame(self, hold["frame"])
+        self.close_movie_pipe()
+        return
+
+    file_path = hold["file_path"] or self.partial_movie_files[self.renderer.num_plays]
+    self.partial_movie_file_path = file_path
+    encode_hold(hold["frame"], hold["count"], file_path)
+    holds += 1
+    held_frames += hold["count"]
+    logger.info(
+        f"Animation {self.renderer.num_plays} : Static hold of {hold['count']} frames looped into %(path)s",
+        {"path": f"'{file_path}'"},
+    )
+
+
+def report():
+    if holds:
+        logger.info(f"Static holds: {holds} looped, {held_frames} frames not piped")
+
+
+def install(min_frames=None):
+    """
+    Routes static holds through encode_hold(). Does nothing unless CYLOPT_STATIC_HOLDS
+    is set or min_frames is given.
+
+    Args:
+    min_frames (int): Shortest hold (in frames) to loop instead of pipe, defaults to
+        $CYLOPT_STATIC_HOLDS if that's a number, MIN_HOLD_FRAMES otherwise.
+    """
+    global _installed, min_hold_frames
+    setting = os.environ.get("CYLOPT_STATIC_HOLDS")
+    if _installed or (min_frames is None and not setting):
+        return
+    if min_frames is None:
+        # "1" and friends just switch it on
+        min_frames = int(setting) if setting.isdigit() and int(setting) > 1 else MIN_HOLD_FRAMES
+    min_hold_frames = max(int(min_frames), 2)
+
+    SceneFileWriter.begin_animation = _held_begin_animation
+    SceneFileWriter.write_frame = _held_write_frame
+    SceneFileWriter.end_animation = _held_end_animation
+    atexit.register(report)
+    _installed = True
@@ -0,0 +1,138 @@
+"""
+Photos, downscaled once and cached as raw RGBA.
+
+ImageMobject decodes the whole file (a 12 MP phone photo for MiniCoke and Salt) and
+the Cairo camera resamples that full array down to its on-screen size on every
+frame it's drawn. CachedImage instead decodes the photo once, straight to the
+pixel size it's shown at for the current quality, and stores the result as a .npy
+file in the "images" disk cache (see disk_cache.py). Building the mobject only
+reads the file's header for its size: the pixels are decoded (on a miss) or
+memory-mapped (on a hit) the first time something needs them, usually the camera
+drawing it, and each frame resamples an array that's already the right size.
+
+Entries are keyed by the file's resolved path, size and modification time and the
+target size, so checking for one never reads the photo. Paths can be given with
+either kind of slash.
+"""
+import math
+from pathlib import Path
+
+import numpy as np
+from manim import DOWN, LEFT, RIGHT, UP, ImageMobject, config
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from PIL import Image
+
+from disk_cache import DiskCache
+
+image_cache = DiskCache("images", max_mb=1024)
+
+BASE_DIR = Path(__file__).parent
+
+
+def resolve(path, base_dir=BASE_DIR):
+    """
+    Makes an image path absolute, relative paths are relative to `base_dir`.
+
+    Windows-style separators (imgs\\coke.jpg) are accepted everywhere.
+    """
+    path = Path(str(path).replace("\\", "/"))
+    if not path.is_absolute():
+        path = Path(base_dir) / path
+    return path.resolve()
+
+
+def _target_size(image, pixel_height):
+    # Never upscale, the camera does that just as well
+    pixel_height = min(pixel_height, image.height)
+    return max(round(image.width * pixel_height / image.height), 1), pixel_height
+
+
+def image_size(path, pixel_height):
+    """
+    The (width, height) in pixels an image is cached at, from its header alone.
+
+    Args:
+    path (Path): The image file.
+    pixel_height (int): Height in pixels to scale it down to.
+
+    Returns:
+    tuple: (width, height), the shape load_pixels() will return.
+    """
+    with Image.open(path) as image:
+        return _target_size(image, pixel_height)
+
+
+def _decode(path, pixel_height):
+    with Image.open(path) as image:
+        size = _target_size(image, pixel_height)
+        # Lets the JPEG decoder scale by powers of two while decoding, far cheaper than resizing after
+        image.draft("RGB", size)
+        image = image.convert("RGBA")
+        if image.size != size:
+            image = image.resize(size, Image.Resampling.LANCZOS)
+        return np.asarray(image)
+
+
+def load_pixels(path, pixel_height):
+    """
+    An image's RGBA pixels at the given height, from the cache if they're there.
+
+    Args:
+    path (Path): The image file.
+    pixel_height (int): Height in pixels to scale it down to.
+
+    Returns:
+    np.memmap: (height, width, 4) uint8 array, copy-on-write so fades can modify it.
+    """
+    stat = Path(path).stat()
+    key = image_cache.key(str(path), stat.st_size, stat.st_mtime_ns, int(pixel_height))
+    cached = image_cache.get(key, ".npy")
+    if cached is None:
+        pixels = _decode(path, int(pixel_height))
+        cached = image_cache.put_with(key, ".npy", lambda f: np.save(f, pixels))
+    return np.load(cached, mmap_mode="c")
+
+
+class CachedImage(ImageMobject):
+    """
+    An ImageMobject of a photo, displayed `height` scene units tall.
+
+    The pixels are only loaded (see load_pixels()) the first time pixel_array is read.
+
+    Args:
+    path (Path): The image file, see resolve().
+    height (float): Height in scene units.
+    """
+
+    def __init__(self, path, height, **kwargs):
+        self.path = resolve(path)
+        self.pixel_height = max(math.ceil(height / config["frame_height"] * config["pixel_height"]), 1)
+        self.pixel_size = image_size(self.path, self.pixel_height)
+        self._pixels = None
+
+        # ImageMobject.__init__ would load the array into memory, only the attributes it sets are needed
+        self.fill_opacity = 1
+        self.stroke_opacity = 1
+        self.invert = False
+        self.image_mode = "RGBA"
+        AbstractImageMobject.__init__(self, config["pixel_height"], **kwargs)
+        self.height = height
+
+    @property
+    def pixel_array(self):
+        if self._pixels is None:
+            self._pixels = load_pixels(self.path, self.pixel_height)
+        return self._pixels
+
+    @pixel_array.setter
+    def pixel_array(self, pixels):
+        self._pixels = pixels
+
+    def reset_points(self):
+        # Same as AbstractImageMobject.reset_points, but sized from the header instead of the pixels
+        width, pixel_height = self.pixel_size
+        self.points = np.array([UP + LEFT, UP + RIGHT, DOWN + LEFT, DOWN + RIGHT])
+        self.center()
+        frame_height = pixel_height / self.scale_to_resolution * config["frame_height"]
+        self.stretch_to_fit_height(frame_height)
+        self.stretch_to_fit_width(frame_height * width / pixel_height)
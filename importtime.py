@@ -0,0 +1,98 @@
+"""
+Import-time report, to keep cold start of the scenes (and of every pool worker) in check.
+
+Imports a module in a fresh interpreter under `python -X importtime` and sums the
+times it reports, per module (self and cumulative) and per top-level package. With
+a budget, exits with 1 when the total goes over it, so it can gate a render farm
+image or CI job:
+
+    python importtime.py cylinder_optimization --budget 2.5
+
+The budget can also come from CYLOPT_IMPORT_BUDGET (seconds). Runs are noisy, the
+fastest of --repeat runs is reported.
+
+Usage:
+    python importtime.py [MODULE] [--budget SECONDS] [--repeat N] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+
+def measure(module="cylinder_optimization"):
+    """
+    Imports a module in a new interpreter and collects its import times.
+
+    Args:
+    module (str): Module to import, from this directory.
+
+    Returns:
+    list: (module, self seconds, cumulative seconds, depth) for every module imported,
+        in the order the imports finished.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent, capture_output=True, text=True,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        # import time:       self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(self_us) / 1e6, int(cumulative_us) / 1e6, depth))
+    return modules
+
+
+def by_package(modules):
+    """Self time summed per top-level package, most expensive first."""
+    totals = defaultdict(float)
+    for name, self_time, _, _ in modules:
+        totals[name.split(".")[0]] += self_time
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def report(modules, top=20):
+    total = sum(self_time for _, self_time, _, _ in modules)
+    lines = [f"{len(modules)} modules imported in {total * 1000:.0f} ms", ""]
+
+    lines.append(f"{'Package':<32}{'Self ms':>10}{'Share':>8}")
+    for package, seconds in by_package(modules)[:top]:
+        lines.append(f"{package:<32}{seconds * 1000:>10.1f}{seconds / total:>8.1%}")
+
+    lines += ["", f"{'Module':<48}{'Self ms':>10}{'Cumul. ms':>11}"]
+    for name, self_time, cumulative, _ in sorted(modules, key=lambda m: m[1], reverse=True)[:top]:
+        lines.append(f"{name:<48}{self_time * 1000:>10.1f}{cumulative * 1000:>11.1f}")
+    return total, "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report how long importing a module takes, and what it's spent on.")
+    parser.add_argument("module", nargs="?", default="cylinder_optimization")
+    parser.add_argument("--budget", type=float, default=os.environ.get("CYLOPT_IMPORT_BUDGET"),
+                        help="Fail if the import takes longer than this many seconds")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs to take the fastest of")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    args = parser.parse_args(argv)
+
+    runs = [measure(args.module) for _ in range(max(args.repeat, 1))]
+    modules = min(runs, key=lambda run: sum(self_time for _, self_time, _, _ in run))
+    total, text = report(modules, args.top)
+    print(text)
+
+    if args.budget is not None:
+        budget = float(args.budget)
+        print(f"\n{'Over' if total > budget else 'Within'} budget: {total:.2f}s of {budget:.2f}s")
+        return 1 if total > budget else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,426 @@
+"""
+Custom mobjects used by the scenes, mostly cheaper stand-ins for things that used
+to be rebuilt on every frame.
+"""
+import copy
+
+import numpy as np
+from manim import (
+    DOWN, ORIGIN, PI, RIGHT, UP, WHITE, Brace, Cylinder, LabeledArrow, Line, MathTex, Mobject, PMobject,
+    VGroup, VMobject, color_to_rgba,
+)
+
+
+class ParametricFamily(VMobject):
+    """
+    A graph y = function(x, p) on some axes, for every p in a range at once.
+
+    All the curves get evaluated with NumPy in one go when the family is created.
+    set_parameter() then just interpolates between the two nearest precomputed
+    curves into a preallocated point array, so sweeping p each frame doesn't build
+    (or allocate) anything. Drop-in replacement for always_redraw(lambda: axes.plot(...)).
+
+    Args:
+    axes (Axes): The (linear) axes to draw on. Should be in its final position.
+    function (Callable): function(x, p), must work on NumPy arrays.
+    p_range (list): [p_min, p_max], the range p will be swept over.
+    x_range (list or Callable): [x_min, x_max], or a function of p returning it
+        (also on NumPy arrays) when the domain depends on p.
+    p_samples (int): Number of precomputed curves.
+    x_samples (int): Number of points along each curve.
+    **kwargs: Passed on to VMobject, e.g. color.
+    """
+
+    def __init__(self, axes, function, p_range, x_range, p_samples=256, x_samples=256, **kwargs):
+        super().__init__(**kwargs)
+        if p_samples < 2 or x_samples < 2:
+            raise ValueError("ParametricFamily needs at least 2 samples of p and x")
+
+        self.p_values = np.linspace(p_range[0], p_range[1], p_samples)
+        self._p_indices = np.arange(p_samples, dtype=float)
+
+        bounds = x_range(self.p_values) if callable(x_range) else x_range
+        x_min, x_max = (np.broadcast_to(np.asarray(bound, dtype=float), self.p_values.shape) for bound in bounds)
+        t = np.linspace(0, 1, x_samples)
+        x = x_min[:, None] + (x_max - x_min)[:, None] * t
+        y = np.broadcast_to(function(x, self.p_values[:, None]), x.shape)
+
+        # Linear axes, so graph coordinates map to the scene with one affine transform
+        origin = axes.c2p(0, 0)
+        x_unit = axes.c2p(1, 0) - origin
+        y_unit = axes.c2p(0, 1) - origin
+        anchors = origin + x[..., None] * x_unit + y[..., None] * y_unit
+
+        # Straight cubic segments between the samples, every curve in one array
+        starts = anchors[:, :-1]
+        deltas = anchors[:, 1:] - starts
+        self._curves = np.stack(
+            [starts, starts + deltas / 3, starts + 2 * deltas / 3, anchors[:, 1:]],
+            axis=2,
+        ).reshape(p_samples, -1, 3)
+
+        self._buffer = self._curves[0].copy()
+        self.points = self._buffer
+
+    def set_parameter(self, p):
+        """
+        Shows the curve for parameter p (clamped to p_range), in place.
+
+        Args:
+        p (float): The parameter value.
+
+        Returns:
+        ParametricFamily: self, for chaining.
+        """
+        position = np.interp(p, self.p_values, self._p_indices)
+        i = min(int(position), len(self.p_values) - 2)
+        alpha = position - i
+
+        # buffer = curves[i] + alpha * (curves[i + 1] - curves[i]), without temporaries
+        buffer = self._buffer
+        np.subtract(self._curves[i + 1], self._curves[i], out=buffer)
+        buffer *= alpha
+        buffer += self._curves[i]
+
+        # Animations like Create swap in their own point arrays, take ours back
+        if self.points is not buffer:
+            self.points = buffer
+        return self
+
+
+class NumberLinePointer(LabeledArrow):
+    """
+    A labelled arrow pointing at a value on a number line, driven by a ValueTracker.
+
+    Looks exactly like the LabeledArrow pointers the scenes used to build by hand,
+    but the arrow, tip and label are only built once. update_position() moves the
+    whole thing with a single shift, instead of put_start_and_end_on() redoing the
+    tip, label and stroke geometry every frame.
+
+    Args:
+    label (str): The label on the arrow.
+    number_line (NumberLine): The number line to point at.
+    tracker (ValueTracker): The tracker driving the pointer.
+    func (Callable): Maps the tracker's value to a number on the line, defaults to
+        the value itself.
+    length (float): Length of the arrow.
+    direction (np.ndarray): Which side of the line the arrow comes from.
+    **kwargs: Passed on to LabeledArrow.
+    """
+
+    def __init__(self, label, number_line, tracker, func=None, length=2, direction=UP, **kwargs):
+        self.number_line = number_line
+        self.tracker = tracker
+        self.func = func or (lambda value: value)
+        kwargs = {
+            "label_position": 0.7,
+            "label_frame": False,
+            "frame_fill_opacity": 0,
+            "max_stroke_width_to_length_ratio": 0,
+            "buff": 0,
+            "color": WHITE,
+            **kwargs,
+        }
+        target = self.get_target()
+        super().__init__(label, start=target + direction * length, end=target, **kwargs)
+
+    def get_number(self):
+        return self.func(self.tracker.get_value())
+
+    def get_target(self):
+        """Where the tip should be for the tracker's current value."""
+        return self.number_line.n2p(self.get_number())
+
+    def update_position(self):
+        # The tip is wherever the arrow really is, so moving the number line
+        # (or the pointer) with anything else is fine
+        self.shift(self.get_target() - self.tip.tip_point)
+        return self
+
+
+class PointerGroup(VGroup):
+    """
+    Several NumberLinePointers moved together in one vectorized shift per frame.
+
+    All the pointers' points are packed into one array (each mobject's points
+    become a view into it), so update_positions() is a single NumPy add no matter
+    how many pointers there are. If anything replaces a point array, the group
+    just repacks on the next update.
+
+    Args:
+    *pointers (NumberLinePointer): The pointers to move together.
+    """
+
+    def __init__(self, *pointers, **kwargs):
+        super().__init__(*pointers, **kwargs)
+        self._buffer = None
+        self._members = []
+        self._owners = None
+
+    def _is_packed(self):
+        members = [m for m in self.get_family() if m.has_points()]
+        return (
+            self._buffer is not None
+            and len(members) == len(self._members)
+            and all(m is old and m.points.base is self._buffer for m, old in zip(members, self._members))
+        )
+
+    def _pack(self):
+        self._members = []
+        owners = []
+        for i, pointer in enumerate(self.submobjects):
+            for m in pointer.get_family():
+                if m.has_points():
+                    self._members.append(m)
+                    owners.append(np.full(len(m.points), i))
+        self._buffer = np.concatenate([m.points for m in self._members])
+        self._owners = np.concatenate(owners)
+        start = 0
+        for m in self._members:
+            end = start + len(m.points)
+            m.points = self._buffer[start:end]
+            start = end
+
+    def update_positions(self):
+        deltas = np.array([p.get_target() - p.tip.tip_point for p in self.submobjects])
+        if not deltas.any():
+            return self
+        if not self._is_packed():
+            self._pack()
+        self._buffer += deltas[self._owners]
+        return self
+
+
+class PointCloud(PMobject):
+    """
+    Lots of points drawn as one mobject, instead of one Dot each.
+
+    Positions and colors live in two preallocated arrays, and set_count() shows the
+    first n points by slicing views of them, so revealing the cloud point by point
+    (from an updater or a ValueTracker) doesn't copy or allocate anything. extend()
+    appends points as they come in, growing the arrays by doubling, so streaming
+    data in a chunk per frame only reallocates a handful of times.
+
+    Args:
+    points (np.ndarray): (n, 3) positions, in reveal order. The cloud should be
+        built in its final place, moving it only moves the points showing.
+    colors (ManimColor or np.ndarray): One color for every point, or an (n, 4)
+        array of RGBA values.
+    stroke_width (float): Size of each point.
+    count (int): How many points to show at first, defaults to all of them.
+    **kwargs: Passed on to PMobject.
+    """
+
+    def __init__(self, points=(), colors=WHITE, stroke_width=2, count=None, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        self._all_points = points
+        self._all_rgbas = self._get_rgbas(colors, len(points))
+        self._size = len(points)
+        self.set_count(self._size if count is None else count)
+
+    @staticmethod
+    def _get_rgbas(colors, n):
+        if isinstance(colors, np.ndarray) and colors.ndim == 2:
+            if len(colors) != n:
+                raise ValueError("PointCloud needs as many colors as points")
+            return np.array(colors, dtype=float)
+        return np.tile(color_to_rgba(colors), (n, 1))
+
+    def get_count(self):
+        return len(self.points)
+
+    def get_size(self):
+        """How many points the cloud holds, shown or not."""
+        return self._size
+
+    def set_count(self, count):
+        """
+        Shows the first `count` points (clamped to how many there are).
+
+        Returns:
+        PointCloud: self, for chaining.
+        """
+        count = int(np.clip(count, 0, self._size))
+        self.points = self._all_points[:count]
+        self.rgbas = self._all_rgbas[:count]
+        return self
+
+    def extend(self, points, colors=WHITE, reveal=True):
+        """
+        Appends points to the cloud.
+
+        Args:
+        points (np.ndarray): (n, 3) positions.
+        colors (ManimColor or np.ndarray): One color, or an (n, 4) RGBA array.
+        reveal (bool): Show every point afterwards, otherwise the count shown
+            stays where it was.
+
+        Returns:
+        PointCloud: self, for chaining.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        rgbas = self._get_rgbas(colors, len(points))
+        count = self.get_count()
+        end = self._size + len(points)
+        if end > len(self._all_points):
+            capacity = max(end, 2 * len(self._all_points), 64)
+            for name in ("_all_points", "_all_rgbas"):
+                old = getattr(self, name)
+                grown = np.empty((capacity, old.shape[1]))
+                grown[:self._size] = old[:self._size]
+                setattr(self, name, grown)
+        self._all_points[self._size:end] = points
+        self._all_rgbas[self._size:end] = rgbas
+        self._size = end
+        return self.set_count(end if reveal else count)
+
+    def fade(self, darkness=0.5, family=True):
+        # PMobject doesn't fade, which FadeIn/FadeOut rely on. Re-slicing afterwards
+        # also relinks the views in copies, where deepcopy made them separate arrays
+        self._all_rgbas[:self._size, 3] *= 1 - darkness
+        self.set_count(self.get_count())
+        return super().fade(darkness, family)
+
+
+# (resolution, show_ends, upright) -> prebuilt Cylinder, see create_cylinder()
+_cylinder_templates = {}
+
+
+def _copy_mesh(mobject, copies=None):
+    """
+    Copies a mobject and its family without Mobject.copy()'s deepcopy.
+
+    Every mobject gets a shallow copy with its own arrays, lists and dicts, anything
+    else (colors, the surface function...) is shared with the original. Attributes
+    pointing at a mobject of the family (like Cylinder's base_top and base_bottom)
+    are pointed at its copy. For a mesh of a thousand faces that's far cheaper than
+    deep copying every face's attributes.
+    """
+    top = copies is None
+    if top:
+        copies = {}
+    copied = copy.copy(mobject)
+    copies[id(mobject)] = copied
+    for name, value in vars(mobject).items():
+        if isinstance(value, np.ndarray):
+            setattr(copied, name, value.copy())
+        elif isinstance(value, (list, dict, set)):
+            setattr(copied, name, type(value)(value))
+    copied.submobjects = [_copy_mesh(submobject, copies) for submobject in mobject.submobjects]
+
+    if top:
+        # Only now is every copy known
+        for original in mobject.get_family():
+            family_copy = copies[id(original)]
+            for name, value in vars(original).items():
+                if name != "submobjects" and isinstance(value, Mobject) and id(value) in copies:
+                    setattr(family_copy, name, copies[id(value)])
+    return copied
+
+
+def create_cylinder(color, resolution=32, show_ends=True, upright=True, fill_opacity=0.5, stroke_width=0):
+    """
+    Creates a cylinder from a per-process template mesh.
+
+    Evaluating the parametric surface only happens the first time a given
+    (resolution, show_ends, upright) combination is asked for. Every other call
+    copies the template's faces with fresh point and color arrays (see _copy_mesh())
+    and restyles them.
+
+    Args:
+    color (ManimColor): Fill color of the cylinder.
+    resolution (int): Number of faces around (and along) the cylinder.
+    show_ends (bool): Whether to add the top and bottom faces.
+    upright (bool): Rotate the cylinder so its axis points UP instead of OUT, the
+        way all the scenes show it.
+    fill_opacity (float): Fill opacity of the faces.
+    stroke_width (float): Stroke width of the faces.
+
+    Returns:
+    Cylinder: A new cylinder of radius 1 and height 2, centered on the origin.
+    """
+    key = (resolution, show_ends, upright)
+    if key not in _cylinder_templates:
+        template = Cylinder(resolution=resolution, checkerboard_colors=False, show_ends=show_ends)
+        if upright:
+            template.rotate(PI / 2, RIGHT)
+        _cylinder_templates[key] = template
+
+    cylinder = _copy_mesh(_cylinder_templates[key])
+    cylinder.set_style(fill_color=color, fill_opacity=fill_opacity, stroke_width=stroke_width)
+    return cylinder
+
+
+# Brace shapes are built for widths rounded to this many scene units, then stretched
+BRACE_WIDTH_STEP = 0.01
+
+# width bucket -> Brace pointing DOWN, label -> MathTex, see create_labeled_braces()
+_brace_templates = {}
+_brace_label_templates = {}
+
+
+def create_brace(mobject, direction=DOWN, buff=0.2, points=None):
+    """
+    Same as Brace(mobject, direction), but built from a per-process template.
+
+    Brace parses its SVG path for every width and rotates the whole mobject there
+    and back to measure it, which adds up for 3D mobjects with thousands of points.
+    Here the points are only measured (rotated as a plain array), and the shape
+    comes from a copy of a cached brace of about the same width.
+
+    Args:
+    mobject (Mobject): The mobject to put the brace next to.
+    direction (np.ndarray): Which side of the mobject the brace goes on.
+    buff (float): Gap between the mobject and the brace.
+    points (np.ndarray): The mobject's get_all_points(), if already at hand.
+
+    Returns:
+    Brace: A new brace.
+    """
+    if points is None:
+        points = mobject.get_all_points()
+    # Measure the mobject turned so that `direction` points down, like Brace does
+    angle = -np.arctan2(*direction[:2]) + np.pi
+    cos, sin = np.cos(-angle), np.sin(-angle)
+    x = points[:, 0] * cos - points[:, 1] * sin
+    y = points[:, 0] * sin + points[:, 1] * cos
+    corner = np.array([x.min(), y.min(), (points[:, 2].min() + points[:, 2].max()) / 2])
+    target_width = x.max() - x.min()
+
+    bucket = max(round(target_width / BRACE_WIDTH_STEP), 1)
+    if bucket not in _brace_templates:
+        _brace_templates[bucket] = Brace(Line(ORIGIN, RIGHT * bucket * BRACE_WIDTH_STEP), direction=DOWN, buff=0)
+
+    brace = _brace_templates[bucket].copy()
+    brace.buff = buff
+    brace.stretch_to_fit_width(target_width)
+    brace.shift(corner - brace.get_corner(UP + LEFT) + buff * DOWN)
+    brace.rotate(angle, about_point=ORIGIN)
+    return brace
+
+
+def create_labeled_braces(mobject, *labels):
+    """
+    Creates labeled braces around a mobject, all in one go.
+
+    The mobject's points are gathered once for all of them, and every label's tex
+    is only built the first time it's used in the process, after that it's copied.
+
+    Args:
+    mobject (Mobject): The mobject to put the braces around.
+    *labels (tuple): (label, direction) pairs, e.g. ("d", DOWN), ("h", RIGHT).
+
+    Returns:
+    list: A VGroup of the brace[0] and its label[1] for every pair, in order.
+    """
+    points = mobject.get_all_points()
+    groups = []
+    for label, direction in labels:
+        brace = create_brace(mobject, direction, points=points)
+        if label not in _brace_label_templates:
+            _brace_label_templates[label] = MathTex(label)
+        brace_label = _brace_label_templates[label].copy()
+        brace.put_at_tip(brace_label)
+        groups.append(VGroup(brace, brace_label))
+    return groups
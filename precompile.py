@@ -0,0 +1,184 @@
+"""
+Compiles every Tex/MathTex a scene is going to need, in parallel, before rendering.
+
+The tex strings are pulled straight out of cylinder_optimization.py with the ast
+module (no need to run the scenes), including the f-strings built from the simple
+constants each scene defines, like `const = "38.78"` or `r = 2.9`. They're then
+built in a process pool sized to the machine, which fills the tex cache
+(see tex_cache.py) so the real render only ever gets cache hits.
+
+The can analysis scenes take their numbers from the can catalog, so they're
+warmed by building them with animations skipped instead (see cans.py).
+
+Usage:
+    python precompile.py [SceneName ...]
+"""
+import ast
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SOURCE_FILE = Path(__file__).with_name("cylinder_optimization.py")
+
+# Mobjects that end up running latex
+TEX_CLASSES = ("MathTex", "Tex", "SingleStringMathTex")
+
+
+class _Unresolved(Exception):
+    pass
+
+
+def _evaluate(node, constants):
+    # Just enough of an evaluator for the tex arguments used in the scenes
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id not in constants:
+            raise _Unresolved(node.id)
+        return constants[node.id]
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _evaluate(node.left, constants) + _evaluate(node.right, constants)
+    if isinstance(node, ast.JoinedStr):
+        return "".join(_evaluate(value, constants) for value in node.values)
+    if isinstance(node, ast.FormattedValue):
+        value = _evaluate(node.value, constants)
+        if node.conversion == ord("r"):
+            value = repr(value)
+        elif node.conversion == ord("s"):
+            value = str(value)
+        elif node.conversion == ord("a"):
+            value = ascii(value)
+        spec = _evaluate(node.format_spec, constants) if node.format_spec else ""
+        return format(value, spec)
+    raise _Unresolved(ast.dump(node))
+
+
+def _find_constants(scope):
+    """Collects `name = <literal>` assignments, dropping any name assigned more than once."""
+    constants = {}
+    ambiguous = set()
+    for node in ast.walk(scope):
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+        try:
+            value = _evaluate(node.value, constants)
+        except _Unresolved:
+            ambiguous.add(target.id)
+            continue
+        if target.id in constants and constants[target.id] != value:
+            ambiguous.add(target.id)
+        constants[target.id] = value
+    for name in ambiguous:
+        constants.pop(name, None)
+    return constants
+
+
+def extract_tex_calls(source_file=SOURCE_FILE, scene_names=None):
+    """
+    Statically finds the Tex/MathTex constructions in each scene class.
+
+    Args:
+    source_file (Path): The file holding the scenes.
+    scene_names (list): Scene classes to look at, or None for all of them.
+
+    Returns:
+    dict: Scene name -> list of (class name, tuple of tex strings), in source order.
+        Calls whose arguments can't be worked out statically are left out.
+    """
+    tree = ast.parse(Path(source_file).read_text(encoding="utf-8"))
+    result = {}
+    for cls in tree.body:
+        if not isinstance(cls, ast.ClassDef):
+            continue
+        if scene_names is not None and cls.name not in scene_names:
+            continue
+        # Sectioned scenes spread construct() over several methods, so look at the whole class
+        constants = _find_constants(cls)
+        calls = []
+        for node in ast.walk(cls):
+            if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)):
+                continue
+            if node.func.id not in TEX_CLASSES:
+                continue
+            try:
+                args = tuple(_evaluate(arg, constants) for arg in node.args)
+            except _Unresolved:
+                continue
+            if args and all(isinstance(arg, str) for arg in args):
+                calls.append((node.lineno, node.func.id, args))
+        result[cls.name] = [call[1:] for call in sorted(calls)]
+    return result
+
+
+def _init_worker():
+    from manim import config
+
+    import tex_cache
+
+    tex_cache.install()
+    # Manim's cleanup deletes every non-svg file in the tex folder, which would pull
+    # .dvi files out from under the other workers
+    config.no_latex_cleanup = True
+
+
+def _compile(call):
+    import manim
+
+    kind, args = call
+    try:
+        getattr(manim, kind)(*args)
+    except Exception as e:
+        return call, f"{type(e).__name__}: {e}"
+    return call, None
+
+
+def warm_cache(scene_names=None, source_file=SOURCE_FILE, max_workers=None):
+    """
+    Compiles every distinct tex string the given scenes use into the tex cache.
+
+    Args:
+    scene_names (list): Scenes to precompile, or None for every scene in the file.
+    source_file (Path): The file holding the scenes.
+    max_workers (int): Pool size, defaults to the number of cores.
+
+    Returns:
+    dict: (class name, tex strings) -> error message, for the ones that failed to
+        compile, and catalog scene name -> error message for can scenes that failed to build.
+    """
+    from manim import logger
+
+    import cans
+
+    catalog = cans.load_catalog()
+    failures = {}
+    can_names = [name for name in catalog if scene_names is None or name in scene_names]
+    for name, error in cans.warm_cache([catalog[name] for name in can_names], max_workers).items():
+        failures[name] = error
+        logger.warning(f"Couldn't prebuild {name}: {error}")
+
+    calls = []
+    for scene_calls in extract_tex_calls(source_file, scene_names).values():
+        calls.extend(scene_calls)
+    # dict.fromkeys keeps the first-seen order, which roughly matches render order
+    calls = list(dict.fromkeys(calls))
+    if not calls:
+        return failures
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(calls)), initializer=_init_worker) as pool:
+        for call, error in pool.map(_compile, calls, chunksize=4):
+            if error is not None:
+                failures[call] = error
+                logger.warning(f"Couldn't precompile {call[0]}{call[1]}: {error}")
+
+    logger.info(f"Precompiled {len(calls) - len(failures)}/{len(calls)} tex expressions")
+    return failures
+
+
+if __name__ == "__main__":
+    failed = warm_cache(sys.argv[1:] or None)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,166 @@
+"""
+Opt-in timing of everything that costs render time.
+
+Set CYLOPT_PROFILE to an output path to record the wall time of every play() call,
+every updater callback, tex compilation and parsing, image decoding and frame
+write. On exit a Chrome trace (open it in chrome://tracing or ui.perfetto.dev)
+is written to that path, and a summary table sorted by total cost is logged.
+Events are labelled with the line in cylinder_optimization.py they came from (see
+source_lines.py).
+A "{pid}" in the path gets replaced by the process id, for pooled renders.
+
+    CYLOPT_PROFILE=trace.json manim -qh cylinder_optimization.py Introduction
+
+Times are inclusive, a play() includes the updaters and frame writes inside it.
+"""
+import atexit
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from manim import ImageMobject, Mobject, Scene, logger
+from manim.mobject.text import tex_mobject
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.scene.scene_file_writer import SceneFileWriter
+
+from source_lines import SOURCE_FILE, scene_line
+
+
+events = []
+_installed = False
+_output = None
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000
+
+
+def _source_line():
+    """The scene line on the current stack (see source_lines.py), as "file:line"."""
+    line, _ = scene_line()
+    return "?" if line is None else f"{SOURCE_FILE.name}:{line}"
+
+
+def _code_line(function):
+    # Updaters are usually lambdas, where they were defined is the useful bit
+    function = getattr(function, "__func__", function)
+    code = getattr(function, "__code__", None)
+    if code is None:
+        return getattr(function, "__qualname__", repr(function))
+    return f"{Path(code.co_filename).name}:{code.co_firstlineno}"
+
+
+def record(category, label, start, **args):
+    """Adds a complete event that started at `start` (microseconds) and ends now."""
+    events.append({
+        "name": f"{category} @ {label}",
+        "cat": category,
+        "ph": "X",
+        "ts": start,
+        "dur": _now_us() - start,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": {"source": label, **args},
+    })
+
+
+def timed(category, get_label=_source_line):
+    """Decorator recording every call of a function as an event."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            label = get_label()
+            start = _now_us()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(category, label, start)
+        return wrapper
+    return decorator
+
+
+def _timed_update(self, dt=0, recursive=True):
+    # Same as Mobject.update, but timing each updater on its own
+    if self.updating_suspended:
+        return self
+    for updater in self.updaters:
+        start = _now_us()
+        if "dt" in updater_parameters(updater):
+            updater(self, dt)
+        else:
+            updater(self)
+        record("updater", _code_line(updater), start, mobject=type(self).__name__)
+    if recursive:
+        for submob in self.submobjects:
+            submob.update(dt, recursive)
+    return self
+
+
+@functools.lru_cache(maxsize=None)
+def updater_parameters(updater):
+    return tuple(inspect.signature(updater).parameters)
+
+
+def summarize(limit=25):
+    """
+    Totals the recorded events per category and source line.
+
+    Returns:
+    list: (category, source, calls, total ms, mean ms) tuples, most expensive first.
+    """
+    totals = defaultdict(lambda: [0, 0.0])
+    for event in events:
+        total = totals[(event["cat"], event["args"]["source"])]
+        total[0] += 1
+        total[1] += event["dur"] / 1000
+    rows = [(cat, source, calls, ms, ms / calls) for (cat, source), (calls, ms) in totals.items()]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return rows[:limit]
+
+
+def write_trace(path):
+    path = Path(str(path).replace("{pid}", str(os.getpid())))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def report():
+    if not events:
+        return
+    path = write_trace(_output)
+    lines = [f"{'Category':<14}{'Source':<32}{'Calls':>8}{'Total ms':>12}{'Mean ms':>10}"]
+    for cat, source, calls, total, mean in summarize():
+        lines.append(f"{cat:<14}{source:<32}{calls:>8}{total:>12.1f}{mean:>10.2f}")
+    logger.info("Profile written to %s\n%s", path, "\n".join(lines))
+
+
+def install(output=None):
+    """
+    Starts recording. Does nothing unless an output path is given or CYLOPT_PROFILE is set.
+
+    Args:
+    output (str): Where to write the Chrome trace, defaults to $CYLOPT_PROFILE.
+    """
+    global _installed, _output
+    output = output or os.environ.get("CYLOPT_PROFILE")
+    if _installed or not output:
+        return
+    _output = output
+
+    Scene.play = timed("play")(Scene.play)
+    Mobject.update = _timed_update
+    # Wraps whatever is installed at this point, so the tex cache hits get timed too
+    tex_mobject.tex_to_svg_file = timed("tex compile")(tex_mobject.tex_to_svg_file)
+    SingleStringMathTex.generate_mobject = timed("tex parse")(SingleStringMathTex.generate_mobject)
+    ImageMobject.__init__ = timed("image decode")(ImageMobject.__init__)
+    SceneFileWriter.write_frame = timed("frame write")(SceneFileWriter.write_frame)
+
+    atexit.register(report)
+    _installed = True
@@ -0,0 +1,199 @@
+"""
+Renders every scene in parallel and joins them into one video.
+
+Scenes are handed to a process pool longest-first, so the slow ones (MiniCoke,
+Salt, Proof) aren't left running alone at the end. A failing scene is reported
+but doesn't stop the others. When everything rendered, the scene videos are
+joined with ffmpeg's concat demuxer using stream copy, so nothing gets re-encoded.
+
+Usage:
+    python render_all.py [-q l|m|h|p|k] [-j WORKERS] [-o OUTPUT] [--partial] [Scene ...]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+SOURCE_FILE = Path(__file__).with_name("cylinder_optimization.py")
+
+# Scenes in the order they appear in the final video, with a rough relative render
+# cost used to schedule the longest ones first
+SCENES = [
+    ("Introduction", 3),
+    ("SquareOptimization", 5),
+    ("CylinderPrediction", 2),
+    ("MiniCoke", 10),
+    ("Salt", 9),
+    ("Proof", 8),
+    ("ConcludingQuestion", 1),
+]
+
+# Same flags as the manim CLI
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def render_scene(scene_name, quality="high_quality", extra_config=None):
+    """
+    Renders a single scene in the current process.
+
+    Args:
+    scene_name (str): Name of the scene class in cylinder_optimization.py, or the
+        class itself (e.g. one made by cans.can_scene()).
+    quality (str): A manim quality name, e.g. "high_quality".
+    extra_config (dict): Any other manim config values to render with.
+
+    Returns:
+    Path: The rendered movie file.
+    """
+    from manim import tempconfig
+
+    import cylinder_optimization
+
+    scene_class = scene_name
+    if isinstance(scene_name, str):
+        scene_class = getattr(cylinder_optimization, scene_name)
+
+    options = {"quality": quality, "input_file": str(SOURCE_FILE)}
+    options.update(extra_config or {})
+    with tempconfig(options):
+        scene = scene_class()
+        scene.render()
+        return Path(scene.renderer.file_writer.movie_file_path)
+
+
+def _render_worker(scene_name, quality, extra_config):
+    # Never let an exception escape the worker, the report is built from these tuples
+    start = time.perf_counter()
+    try:
+        path = render_scene(scene_name, quality, extra_config)
+    except BaseException:
+        return scene_name, False, time.perf_counter() - start, traceback.format_exc()
+    return scene_name, True, time.perf_counter() - start, path
+
+
+def concat_videos(paths, output):
+    """
+    Joins videos with ffmpeg's concat demuxer, without re-encoding.
+
+    All inputs need the same codec, resolution and frame rate, which is always the
+    case for scenes rendered at the same quality.
+
+    Args:
+    paths (list): Video files, in order.
+    output (Path): Where to write the joined video.
+    """
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for path in paths:
+            # The concat demuxer wants single quotes escaped like this
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+        list_file = f.name
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", list_file, "-c", "copy", str(output)],
+            check=True,
+        )
+    finally:
+        os.unlink(list_file)
+
+
+def render_all(scene_names=None, quality="high_quality", max_workers=None,
+               output="media/CylinderOptimization.mp4", partial=False,
+               precompile_tex=True, extra_config=None):
+    """
+    Renders scenes in a process pool and joins the results.
+
+    Args:
+    scene_names (list): Scenes to render, defaults to all of them. They're always
+        joined in story order.
+    quality (str): A manim quality name.
+    max_workers (int): Pool size, defaults to the number of cores.
+    output (Path): The final joined video, or None to skip joining.
+    partial (bool): Join whatever rendered even if some scenes failed.
+    precompile_tex (bool): Warm the tex cache in parallel first (see precompile.py).
+    extra_config (dict): Any other manim config values to render with.
+
+    Returns:
+    dict: Scene name -> (succeeded, seconds, movie path or traceback).
+    """
+    weights = dict(SCENES)
+    if scene_names is None:
+        scene_names = [name for name, _ in SCENES]
+    unknown = [name for name in scene_names if name not in weights]
+    if unknown:
+        raise ValueError(f"Unknown scenes: {', '.join(unknown)}")
+
+    if precompile_tex:
+        import precompile
+        precompile.warm_cache(scene_names, max_workers=max_workers)
+
+    max_workers = max_workers or os.cpu_count() or 1
+    # Pool workers pick up jobs in submission order, so longest-first is just a sort
+    schedule = sorted(scene_names, key=lambda name: weights[name], reverse=True)
+    results = {}
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(schedule))) as pool:
+        futures = [pool.submit(_render_worker, name, quality, extra_config) for name in schedule]
+        for future in as_completed(futures):
+            name, ok, seconds, detail = future.result()
+            results[name] = (ok, seconds, detail)
+            print(f"{'done' if ok else 'FAILED'}: {name} ({seconds:.1f}s)", flush=True)
+
+    print_report(results, scene_names)
+
+    ordered = [name for name, _ in SCENES if name in results]
+    succeeded = [name for name in ordered if results[name][0]]
+    if output is not None and succeeded and (partial or len(succeeded) == len(ordered)):
+        concat_videos([results[name][2] for name in succeeded], output)
+        print(f"Wrote {output}")
+    return results
+
+
+def print_report(results, scene_names):
+    print()
+    print(f"{'Scene':<22}{'Status':<10}{'Time':>9}")
+    for name in scene_names:
+        ok, seconds, detail = results[name]
+        print(f"{name:<22}{'ok' if ok else 'FAILED':<10}{seconds:>8.1f}s")
+    for name in scene_names:
+        ok, _, detail = results[name]
+        if not ok:
+            print(f"\n--- {name} ---\n{detail}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every scene in parallel and join them.")
+    parser.add_argument("scenes", nargs="*", help="Scenes to render (default: all)")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: cores)")
+    parser.add_argument("-o", "--output", default="media/CylinderOptimization.mp4")
+    parser.add_argument("--partial", action="store_true", help="Join the scenes that rendered even if some failed")
+    parser.add_argument("--no-precompile", action="store_true", help="Skip the parallel tex warm-up")
+    args = parser.parse_args(argv)
+
+    results = render_all(
+        args.scenes or None,
+        quality=QUALITIES[args.quality],
+        max_workers=args.jobs,
+        output=args.output,
+        partial=args.partial,
+        precompile_tex=not args.no_precompile,
+    )
+    return 0 if all(ok for ok, _, _ in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Everything from manim that the scenes in cylinder_optimization.py use, imported by name.
+
+cylinder_optimization.py star-imports this instead of manim itself, so the scenes'
+whole manim surface is this one list: anything new has to be added here, from the
+module that defines it. A name that moves between manim versions fails right here
+at import, not halfway through a render.
+
+Python runs manim/__init__.py before any of its submodules, so this doesn't make
+importing manim itself any cheaper. What's left to trim lives in our own modules,
+see importtime.py for measuring it.
+"""
+import numpy as np
+from manim.animation.composition import LaggedStart
+from manim.animation.creation import Create, DrawBorderThenFill, Write
+from manim.animation.fading import FadeIn, FadeOut
+from manim.animation.growing import GrowFromCenter
+from manim.animation.indication import Circumscribe, Indicate
+from manim.animation.transform import FadeTransform, ReplacementTransform, Transform
+from manim.animation.transform_matching_parts import TransformMatchingShapes, TransformMatchingTex
+from manim.constants import DOWN, LEFT, ORIGIN, OUT, PI, RIGHT, UP
+from manim.mobject.geometry.arc import Dot
+from manim.mobject.geometry.line import DashedLine
+from manim.mobject.geometry.polygram import Square
+from manim.mobject.graphing.coordinate_systems import Axes
+from manim.mobject.graphing.number_line import NumberLine
+from manim.mobject.mobject import Group
+from manim.mobject.text.tex_mobject import MathTex, Tex
+from manim.mobject.text.text_mobject import Paragraph
+from manim.mobject.three_d.three_dimensions import Cube
+from manim.mobject.types.vectorized_mobject import VGroup
+from manim.mobject.value_tracker import ValueTracker
+from manim.scene.scene import Scene
+from manim.scene.three_d_scene import ThreeDScene
+from manim.utils.color.core import color_to_rgba
+from manim.utils.color.manim_colors import BLUE, GREEN, RED, RED_B, WHITE, YELLOW
+from manim.utils.rate_functions import linear
+
+__all__ = [
+    # Constants
+    "DOWN", "LEFT", "ORIGIN", "OUT", "PI", "RIGHT", "UP",
+    "BLUE", "GREEN", "RED", "RED_B", "WHITE", "YELLOW",
+    # Mobjects
+    "Axes", "Cube", "DashedLine", "Dot", "Group", "MathTex", "NumberLine",
+    "Paragraph", "Square", "Tex", "VGroup", "ValueTracker",
+    # Animations
+    "Circumscribe", "Create", "DrawBorderThenFill", "FadeIn", "FadeOut", "FadeTransform",
+    "GrowFromCenter", "Indicate", "LaggedStart", "ReplacementTransform", "Transform",
+    "TransformMatchingShapes", "TransformMatchingTex", "Write",
+    # Scenes
+    "Scene", "ThreeDScene",
+    # Utilities
+    "color_to_rgba", "linear", "np",
+]
@@ -0,0 +1,156 @@
+"""
+Incremental, section-by-section rendering.
+
+A scene using SectionedScene lists its section methods in `sections`, and its
+construct() just plays them in order (each one becomes a manim section). When
+rendered through render_incremental(), every section's video is cached under a
+hash of:
+    - the section method's source code,
+    - the state of the scene coming into it (all mobjects on screen),
+    - the key of the section before it, so a change invalidates everything downstream,
+    - whatever the scene's section_inputs() returns, for data the sections read from
+      somewhere other than the screen,
+    - the output resolution and frame rate.
+Sections with a cached video are fast-forwarded with animation skipping on (so the
+following sections still see the right state) instead of being rendered again.
+
+Note that only the section method's own source is hashed, helpers it calls (like
+create_labled_brace) aren't.
+
+Usage:
+    python sections.py SceneName [-q l|m|h|p|k] [-o OUTPUT]
+"""
+import argparse
+import inspect
+import sys
+import zlib
+from pathlib import Path
+
+from manim import config, logger
+from manim.utils.hashing import _Memoizer, get_json
+
+from disk_cache import DiskCache
+
+section_cache = DiskCache("sections", max_mb=4096)
+
+# Only look things up in the cache when rendering through render_incremental(),
+# a plain `manim` run renders every section as usual
+incremental = False
+
+
+def get_state_hash(scene):
+    """Hash of every mobject currently in the scene, the same way manim hashes play() calls."""
+    _Memoizer.mark_as_processed(scene)
+    try:
+        mobjects_json = [get_json(mob) for mob in scene.mobjects]
+    finally:
+        _Memoizer.reset_already_processed()
+    return zlib.crc32(repr(mobjects_json).encode())
+
+
+class SectionedScene:
+    """
+    Mixin for scenes split into named section methods, e.g.
+
+        class Salt(SectionedScene, ThreeDScene):
+            sections = ("measurement", "surface_area", ...)
+
+    State shared between sections lives on self.
+    """
+
+    sections = ()
+
+    def section_inputs(self):
+        """Anything else the sections depend on, hashed into every section key."""
+        return ()
+
+    def construct(self):
+        # (name, key, cached video or None) for every section, read by render_incremental()
+        self.section_keys = []
+        upstream = ""
+        for name in self.sections:
+            method = getattr(self, name)
+            key = section_cache.key(
+                type(self).__name__,
+                name,
+                upstream,
+                self.section_inputs(),
+                inspect.getsource(method),
+                get_state_hash(self),
+                config.pixel_width,
+                config.pixel_height,
+                config.frame_rate,
+                config.movie_file_extension,
+            )
+            cached = section_cache.get(key, config.movie_file_extension) if incremental else None
+            if cached is not None:
+                logger.info(f"Section '{name}' is unchanged, reusing {cached.name}")
+
+            self.next_section(name, skip_animations=cached is not None)
+            method()
+            self.section_keys.append((name, key, cached))
+            upstream = key
+
+
+def render_incremental(scene_name, quality="high_quality", output=None):
+    """
+    Renders a SectionedScene, re-rendering only the sections whose inputs changed.
+
+    Args:
+    scene_name (str): Name of the scene class in cylinder_optimization.py.
+    quality (str): A manim quality name.
+    output (Path): Where to write the joined video, defaults to media/sections/<scene>.mp4.
+
+    Returns:
+    list: (section name, whether it was re-rendered) pairs, in order.
+    """
+    global incremental
+    from manim import tempconfig
+
+    import cylinder_optimization
+    from render_all import SOURCE_FILE, concat_videos
+
+    output = Path(output or f"media/sections/{scene_name}.mp4")
+    options = {"quality": quality, "input_file": str(SOURCE_FILE), "save_sections": True}
+
+    incremental = True
+    try:
+        with tempconfig(options):
+            scene = getattr(cylinder_optimization, scene_name)()
+            if not isinstance(scene, SectionedScene):
+                raise TypeError(f"{scene_name} isn't split into sections")
+            scene.render()
+            file_writer = scene.renderer.file_writer
+            rendered = {section.name: section.video for section in file_writer.sections}
+            videos = []
+            summary = []
+            for name, key, cached in scene.section_keys:
+                if cached is None:
+                    cached = section_cache.put_file(
+                        key, config.movie_file_extension,
+                        file_writer.sections_output_dir / rendered[name])
+                videos.append(cached)
+                summary.append((name, rendered.get(name) is not None))
+    finally:
+        incremental = False
+
+    concat_videos(videos, output)
+    return summary
+
+
+def main(argv=None):
+    from render_all import QUALITIES
+
+    parser = argparse.ArgumentParser(description="Render a scene, re-rendering only changed sections.")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=QUALITIES, default="h")
+    parser.add_argument("-o", "--output", default=None)
+    args = parser.parse_args(argv)
+
+    for name, rerendered in render_incremental(args.scene, QUALITIES[args.quality], args.output):
+        print(f"{name:<16}{'rendered' if rerendered else 'cached'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
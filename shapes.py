@@ -0,0 +1,371 @@
+"""
+Volume-maximizing dimensions of solids under a surface area constraint.
+
+Every shape here is described by a width-like dimension x and a height-like one y
+(r and h for a cylinder, a and h for a square prism, ...). For a given surface
+area S the constraint fixes y as a function of x, which leaves a one-dimensional
+problem: maximize V(x, y(x)). solve() does that for a whole array of S values at
+once, with a safeguarded Newton iteration on dV/dx (falling back to bisection
+whenever a Newton step would leave the bracket around the maximum). The
+derivatives are central differences, so adding a shape only takes its surface,
+volume and y(x).
+
+Shapes with a known analytic optimum are registered in `closed_forms`, which
+solve() uses instead of iterating unless told otherwise.
+
+The same thing works in 2D, the rectangle's "surface" is its perimeter and its
+"volume" its area.
+
+Usage:
+    python shapes.py [shape ...] [-S 24 54 100]
+"""
+import argparse
+import sys
+
+import numpy as np
+
+
+class Shape:
+    """
+    A family of solids with a width-like dimension x and a height-like one y.
+
+    Subclasses define surface(), volume(), height() (y for a given x and surface
+    area) and x_max() (the largest x that still leaves y >= 0), plus how to draw it.
+    """
+
+    name = ""
+    # Labels the scenes use, for the dimension drawn across and the one drawn up
+    x_label = "x"
+    width_label = "x"
+    y_label = "y"
+    # The optimum as tex, when there's a nice way to put it
+    optimum_tex = None
+
+    def surface(self, x, y):
+        raise NotImplementedError
+
+    def volume(self, x, y):
+        raise NotImplementedError
+
+    def height(self, x, surface):
+        raise NotImplementedError
+
+    def x_max(self, surface):
+        raise NotImplementedError
+
+    def width(self, x):
+        """How wide the shape is drawn, e.g. 2r for round ones."""
+        return x
+
+    def total_height(self, x, y):
+        """How tall the shape is drawn."""
+        return y
+
+    def build(self, x, y, color):
+        """Makes a mobject of the shape, centered on the origin with y pointing UP."""
+        raise NotImplementedError
+
+
+class RectangleShape(Shape):
+    name = "rectangle"
+    x_label = width_label = "l"
+    y_label = "w"
+    optimum_tex = "l=w"
+
+    def surface(self, x, y):
+        return 2 * (x + y)
+
+    def volume(self, x, y):
+        return x * y
+
+    def height(self, x, surface):
+        return surface / 2 - x
+
+    def x_max(self, surface):
+        return surface / 2
+
+    def build(self, x, y, color):
+        from manim import Rectangle
+
+        return Rectangle(width=x, height=y, color=color, fill_opacity=0.5)
+
+
+class SquarePrismShape(Shape):
+    name = "square_prism"
+    x_label = width_label = "a"
+    y_label = "h"
+    optimum_tex = "h=a"
+
+    def surface(self, x, y):
+        return 2 * x ** 2 + 4 * x * y
+
+    def volume(self, x, y):
+        return x ** 2 * y
+
+    def height(self, x, surface):
+        return (surface - 2 * x ** 2) / (4 * x)
+
+    def x_max(self, surface):
+        return np.sqrt(surface / 2)
+
+    def build(self, x, y, color):
+        from manim import Prism
+
+        return Prism(dimensions=[x, y, x], fill_color=color, fill_opacity=0.5, stroke_width=0)
+
+
+class CylinderShape(Shape):
+    name = "cylinder"
+    x_label = "r"
+    width_label = "d"
+    y_label = "h"
+    optimum_tex = "d=h"
+
+    def surface(self, x, y):
+        return 2 * np.pi * x * (x + y)
+
+    def volume(self, x, y):
+        return np.pi * x ** 2 * y
+
+    def height(self, x, surface):
+        return surface / (2 * np.pi * x) - x
+
+    def x_max(self, surface):
+        return np.sqrt(surface / (2 * np.pi))
+
+    def width(self, x):
+        return 2 * x
+
+    def build(self, x, y, color):
+        from mobjects import create_cylinder
+
+        return create_cylinder(color).scale([x, y / 2, x])
+
+
+class ConeShape(Shape):
+    name = "cone"
+    x_label = "r"
+    width_label = "d"
+    y_label = "h"
+    optimum_tex = R"h=\sqrt{2}d"
+
+    def surface(self, x, y):
+        return np.pi * x * (x + np.sqrt(x ** 2 + y ** 2))
+
+    def volume(self, x, y):
+        return np.pi * x ** 2 * y / 3
+
+    def height(self, x, surface):
+        slant = surface / (np.pi * x) - x
+        return np.sqrt(np.maximum(slant ** 2 - x ** 2, 0))
+
+    def x_max(self, surface):
+        return np.sqrt(surface / (2 * np.pi))
+
+    def width(self, x):
+        return 2 * x
+
+    def build(self, x, y, color):
+        from manim import ORIGIN, UP, Cone
+
+        cone = Cone(base_radius=x, height=y, direction=UP, show_base=True, checkerboard_colors=False,
+                    fill_color=color, fill_opacity=0.5, stroke_width=0)
+        return cone.move_to(ORIGIN)
+
+
+class CapsuleShape(Shape):
+    """A cylinder of radius r and length h with a hemisphere on each end."""
+
+    name = "capsule"
+    x_label = "r"
+    width_label = "d"
+    y_label = "h"
+    optimum_tex = R"h=0\text{ (a sphere)}"
+
+    def surface(self, x, y):
+        return 2 * np.pi * x * y + 4 * np.pi * x ** 2
+
+    def volume(self, x, y):
+        return np.pi * x ** 2 * y + 4 / 3 * np.pi * x ** 3
+
+    def height(self, x, surface):
+        return surface / (2 * np.pi * x) - 2 * x
+
+    def x_max(self, surface):
+        return np.sqrt(surface / (4 * np.pi))
+
+    def width(self, x):
+        return 2 * x
+
+    def total_height(self, x, y):
+        return y + 2 * x
+
+    def build(self, x, y, color):
+        from manim import DOWN, PI, RIGHT, UP, Sphere, VGroup
+
+        from mobjects import create_cylinder
+
+        # A zero-length middle would scale the mesh flat, which Transform doesn't like
+        y = max(y, 1e-3)
+        style = {"checkerboard_colors": False, "fill_color": color, "fill_opacity": 0.5, "stroke_width": 0}
+        top = Sphere(radius=x, v_range=[0, PI / 2], **style).rotate(-PI / 2, RIGHT).shift(UP * y / 2)
+        bottom = Sphere(radius=x, v_range=[0, PI / 2], **style).rotate(PI / 2, RIGHT).shift(DOWN * y / 2)
+        middle = create_cylinder(color, show_ends=False).scale([x, y / 2, x])
+        return VGroup(bottom, middle, top)
+
+
+class TriangularPrismShape(Shape):
+    """An equilateral triangle of side a, extruded by h."""
+
+    name = "triangular_prism"
+    x_label = width_label = "a"
+    y_label = "h"
+    optimum_tex = R"h=\frac{a}{\sqrt{3}}"
+
+    def surface(self, x, y):
+        return np.sqrt(3) / 2 * x ** 2 + 3 * x * y
+
+    def volume(self, x, y):
+        return np.sqrt(3) / 4 * x ** 2 * y
+
+    def height(self, x, surface):
+        return (surface - np.sqrt(3) / 2 * x ** 2) / (3 * x)
+
+    def x_max(self, surface):
+        return np.sqrt(2 * surface / np.sqrt(3))
+
+    def build(self, x, y, color):
+        from manim import Polygon, VGroup
+
+        # Triangle in the floor plane (x and z), extruded along y
+        angles = np.pi / 2 + np.array([0, 2, 4]) * np.pi / 3
+        corners = np.stack([np.cos(angles), np.zeros(3), np.sin(angles)], axis=1) * x / np.sqrt(3)
+        bottom = corners - [0, y / 2, 0]
+        top = corners + [0, y / 2, 0]
+        style = {"fill_color": color, "fill_opacity": 0.5, "stroke_width": 0}
+        faces = [Polygon(*bottom, **style), Polygon(*top, **style)]
+        for i in range(3):
+            j = (i + 1) % 3
+            faces.append(Polygon(bottom[i], bottom[j], top[j], top[i], **style))
+        return VGroup(*faces)
+
+
+SHAPES = {shape.name: shape for shape in (
+    RectangleShape(),
+    SquarePrismShape(),
+    CylinderShape(),
+    ConeShape(),
+    CapsuleShape(),
+    TriangularPrismShape(),
+)}
+
+# Shape name -> function(surface) returning the optimal (x, y), for shapes where
+# the optimum is known analytically
+closed_forms = {
+    "rectangle": lambda s: (s / 4, s / 4),
+    "square_prism": lambda s: (np.sqrt(s / 6), np.sqrt(s / 6)),
+    "cylinder": lambda s: (np.sqrt(s / (6 * np.pi)), 2 * np.sqrt(s / (6 * np.pi))),
+    "cone": lambda s: (np.sqrt(s / (4 * np.pi)), 2 * np.sqrt(2) * np.sqrt(s / (4 * np.pi))),
+    # V only grows with r until the cylinder part is gone, so the best capsule is a sphere
+    "capsule": lambda s: (np.sqrt(s / (4 * np.pi)), np.zeros_like(s)),
+    "triangular_prism": lambda s: (np.sqrt(2 * s / (3 * np.sqrt(3))), np.sqrt(2 * s / (3 * np.sqrt(3))) / np.sqrt(3)),
+}
+
+
+def _newton(shape, surface, iterations, tolerance):
+    # Bracket [lo, hi] around the maximum of V(x), dV/dx > 0 at lo and < 0 at hi
+    hi = shape.x_max(surface)
+    lo = hi * 1e-6
+    hi = hi * (1 - 1e-9)
+
+    def volume(x):
+        return shape.volume(x, shape.height(x, surface))
+
+    def slope(x):
+        step = 1e-5 * x
+        before, at, after = volume(x - step), volume(x), volume(x + step)
+        return (after - before) / (2 * step), (after - 2 * at + before) / step ** 2
+
+    # Maxima on the edge of the domain, like the capsule's
+    at_lo = slope(lo)[0] <= 0
+    at_hi = slope(hi)[0] >= 0
+
+    x = (lo + hi) / 2
+    # Every surface area stops on its own once converged, so the odd slow one
+    # doesn't keep the finite differences of the rest churning in the noise
+    active = ~(at_lo | at_hi)
+    for _ in range(iterations):
+        first, second = slope(x)
+        lo = np.where(first > 0, x, lo)
+        hi = np.where(first > 0, hi, x)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = -first / second
+        # Newton steps down in the finite difference noise are done, even when the
+        # noise puts them a hair outside the bracket
+        converged = (second < 0) & (np.abs(newton) <= tolerance * x)
+        # Otherwise bisect wherever Newton would jump out of the bracket (or towards a minimum)
+        inside = (second < 0) & (x + newton > lo) & (x + newton < hi)
+        step = np.where(inside | converged, newton, (lo + hi) / 2 - x)
+        x = x + np.where(active, step, 0)
+        active &= ~converged & (np.abs(step) > tolerance * x)
+        if not active.any():
+            break
+
+    x = np.where(at_lo, lo, np.where(at_hi, shape.x_max(surface), x))
+    return x
+
+
+def solve(shape, surface, iterations=100, tolerance=1e-10, numeric=False):
+    """
+    Finds the dimensions with the most volume for every surface area given.
+
+    Args:
+    shape (Shape or str): The shape, or its name in SHAPES.
+    surface (np.ndarray): Surface areas, any shape (or a scalar).
+    iterations (int): Most Newton/bisection steps to take.
+    tolerance (float): Relative step size to stop at.
+    numeric (bool): Always iterate, even if the shape has a closed form.
+
+    Returns:
+    dict: x, y, volume and surface arrays, and ratio (y / width).
+    """
+    if isinstance(shape, str):
+        shape = SHAPES[shape]
+    surface = np.asarray(surface, dtype=float)
+
+    if not numeric and shape.name in closed_forms:
+        x, y = closed_forms[shape.name](surface)
+    else:
+        x = _newton(shape, surface, iterations, tolerance)
+        y = np.maximum(shape.height(x, surface), 0)
+    return {
+        "x": x,
+        "y": y,
+        "volume": shape.volume(x, y),
+        "surface": surface,
+        "ratio": y / shape.width(x),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Volume-maximizing dimensions under a surface area constraint.")
+    parser.add_argument("shapes", nargs="*", help=f"Any of {', '.join(SHAPES)} (default: all)")
+    parser.add_argument("-S", "--surface", type=float, nargs="+", default=[24, 54, 100])
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.shapes if name not in SHAPES]
+    if unknown:
+        parser.error(f"Unknown shapes: {', '.join(unknown)}")
+
+    for name in args.shapes or SHAPES:
+        shape = SHAPES[name]
+        exact = solve(shape, args.surface)
+        numeric = solve(shape, args.surface, numeric=True)
+        print(f"{name}  ({shape.optimum_tex})")
+        for i, surface in enumerate(args.surface):
+            print(f"  S={surface:<8g}{shape.x_label}={numeric['x'][i]:<10.5f}{shape.y_label}={numeric['y'][i]:<10.5f}"
+                  f"V={numeric['volume'][i]:<10.5f}(closed form {shape.x_label}={exact['x'][i]:.5f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+Finding the line of cylinder_optimization.py that something was called from.
+
+Shared by profiling.py and timeline.py, which both label play()/wait() calls with
+the scene line that made them. Calls that go through a small scene helper (like
+CanAnalysis.pause(), which only picks a wait() duration) are labelled with the
+line that called the helper, since that's the one narration and profiles refer to.
+"""
+import sys
+from pathlib import Path
+
+SOURCE_FILE = Path(__file__).with_name("cylinder_optimization.py")
+
+# Methods in SOURCE_FILE that only wrap play()/wait(), skipped over when looking for the line
+HELPERS = {"pause"}
+
+
+def scene_line():
+    """
+    The innermost line of SOURCE_FILE on the current stack that isn't in one of the HELPERS.
+
+    Returns:
+    tuple: (line number, function name), or (None, None) when SOURCE_FILE isn't on the stack.
+    """
+    source = str(SOURCE_FILE)
+    fallback = (None, None)
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_code.co_filename == source:
+            if frame.f_code.co_name not in HELPERS:
+                return frame.f_lineno, frame.f_code.co_name
+            # Only used if the helper wasn't called from the scenes themselves
+            if fallback == (None, None):
+                fallback = (frame.f_lineno, frame.f_code.co_name)
+        frame = frame.f_back
+    return fallback
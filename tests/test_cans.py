@@ -0,0 +1,20 @@
+from pathlib import Path
+
+from cans import _normalize, can_numbers
+
+
+def _entry(**fields):
+    return _normalize({"name": "Soup", "r": 3.3, "h": 10, **fields}, Path("."))
+
+
+def test_percent_digits():
+    assert _entry()["percent_digits"] == 2
+    assert _entry(percent_digits="")["percent_digits"] == 2
+    assert _entry(percent_digits=0)["percent_digits"] == 0
+    assert _entry(percent_digits="1")["percent_digits"] == 1
+
+
+def test_percent_formatting():
+    assert can_numbers(4.25, 13.5, 1)["percent"] == "96.7"
+    assert can_numbers(4.25, 13.5)["percent"] == "96.69"
+    assert can_numbers(4.25, 13.5, 0)["percent"] == "97"
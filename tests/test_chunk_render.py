@@ -0,0 +1,50 @@
+from chunk_render import chunk_config, split_chunks
+
+
+def _check(chunks, count):
+    # Contiguous, in order, covering every animation
+    assert chunks[0][0] == 0
+    assert chunks[-1][1] == count - 1
+    for (_, last), (first, _) in zip(chunks, chunks[1:]):
+        assert first == last + 1
+    for first, last in chunks:
+        assert first <= last
+
+
+def _check_configs(scene_name, chunks):
+    for index, (first, last) in enumerate(chunks):
+        config = chunk_config(scene_name, index, first, last)
+        assert config["from_animation_number"] == first
+        assert config["upto_animation_number"] == last
+        # 0 means no upper bound to manim, only fine when the chunk is the whole scene
+        if len(chunks) > 1:
+            assert config["upto_animation_number"] > 0
+
+
+def test_more_workers_than_animations():
+    durations = [1, 2, 1, 3, 1]
+    for n in (len(durations), len(durations) + 1, 64):
+        chunks = split_chunks(durations, n)
+        _check(chunks, len(durations))
+        assert len(chunks) == len(durations) - 1
+        assert chunks[0] == (0, 1)
+        _check_configs("Salt", chunks)
+
+
+def test_long_first_animation():
+    durations = [30, 1, 1, 1, 1, 1]
+    chunks = split_chunks(durations, 3)
+    _check(chunks, len(durations))
+    assert len(chunks) == 3
+    assert chunks[0][1] > 0
+    _check_configs("Proof", chunks)
+
+
+def test_single_animation():
+    assert split_chunks([5], 4) == [(0, 0)]
+    assert split_chunks([5, 5], 4) == [(0, 1)]
+
+
+def test_even_split():
+    chunks = split_chunks([1] * 8, 4)
+    assert chunks == [(0, 1), (2, 3), (4, 5), (6, 7)]
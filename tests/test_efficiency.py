@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+
+from efficiency import FIELDS, analyze, analyze_file, count_rows
+
+
+def _expected(r, h):
+    surface = 2 * math.pi * r * h + 2 * math.pi * r * r
+    r_opt = math.sqrt(surface / (6 * math.pi))
+    return math.pi * r * r * h / (2 * math.pi * r_opt ** 3)
+
+
+def test_mixed_shapes():
+    r = np.array([1.0, 2.0])
+    h = np.array([[1.0], [3.0]])
+    results = analyze(r, h)
+    for name in FIELDS:
+        assert np.shape(results[name]) == (2, 2)
+    for i, height in enumerate((1.0, 3.0)):
+        for j, radius in enumerate((1.0, 2.0)):
+            assert math.isclose(results["efficiency"][i, j], _expected(radius, height))
+
+
+def test_scalar_against_array():
+    h = np.array([10.3, 13.5, 2.0])
+    results = analyze(2.9, h)
+    assert results["efficiency"].shape == (3,)
+    assert math.isclose(results["efficiency"][0], _expected(2.9, 10.3))
+
+    results = analyze(np.array([[2.9], [4.25]]), 13.5)
+    assert results["volume"].shape == (2, 1)
+
+
+def test_scalars():
+    results = analyze(4.25, 13.5)
+    assert np.ndim(results["efficiency"]) == 0
+    assert math.isclose(float(results["efficiency"]), _expected(4.25, 13.5))
+
+
+def test_optimal_can_is_fully_efficient():
+    results = analyze(np.array([1.0, 3.0]), np.array([2.0, 6.0]), dtype=np.float32)
+    assert results["efficiency"].dtype == np.float32
+    np.testing.assert_allclose(results["efficiency"], 1, rtol=1e-6)
+
+
+def test_count_rows_matches_streamed_rows(tmp_path):
+    path = tmp_path / "cans.csv"
+    path.write_text("name,r,h\ncoke,2.9,10.3\n\nsalt,4.25,13.5\nsoup,3.3,10\n\n", encoding="utf-8")
+    streamed = sum(len(r) for r, _, _ in analyze_file(path, chunk_rows=2))
+    assert streamed == 3
+    assert count_rows(path, chunk_rows=2) == 3
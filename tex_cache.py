@@ -0,0 +1,159 @@
+"""
+Persistent LaTeX cache shared by every scene.
+
+Manim already skips latex when the SVG is sitting in this project's media folder,
+but that folder is per checkout and the SVG still gets parsed into paths for every
+new MathTex. This keeps both the compiled SVG and the parsed path data in a disk
+cache keyed by the exact tex code (expression + environment + template), so a
+full re-render compiles every distinct expression once, in any process.
+
+Call install() once before building any tex (cylinder_optimization.py does).
+"""
+import atexit
+from pathlib import Path
+
+import numpy as np
+from manim import VMobject, config, logger
+from manim.mobject.text import tex_mobject
+from manim.mobject.text.tex_mobject import SingleStringMathTex
+from manim.utils import tex_file_writing
+from manim.utils.color import rgba_to_color
+
+from disk_cache import DiskCache
+
+svg_cache = DiskCache("tex_svg")
+path_cache = DiskCache("tex_paths")
+
+# Number of times latex + dvisvgm actually had to run in this process
+latex_runs = 0
+
+_original_tex_to_svg_file = tex_file_writing.tex_to_svg_file
+_original_generate_mobject = SingleStringMathTex.generate_mobject
+_installed = False
+
+
+def get_tex_code(expression, environment=None, tex_template=None):
+    """
+    Builds the full .tex document manim would compile for an expression.
+
+    Args:
+    expression (str): The tex expression.
+    environment (str): The tex environment, e.g. "align*".
+    tex_template (TexTemplate): Template to use, defaults to config["tex_template"].
+
+    Returns:
+    str: The complete tex source.
+    """
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Drop-in replacement for manim's tex_to_svg_file that goes through the disk cache."""
+    global latex_runs
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    tex_code = get_tex_code(expression, environment, tex_template)
+    key = svg_cache.key(tex_template.tex_compiler, tex_template.output_format, tex_code)
+
+    # Keep manim's own file naming so its in-memory SVG cache still lines up
+    svg_file = config.get_dir("tex_dir") / (tex_file_writing.tex_hash(tex_code) + ".svg")
+
+    cached = svg_cache.get(key, ".svg")
+    if cached is not None:
+        if not svg_file.exists():
+            svg_file.parent.mkdir(parents=True, exist_ok=True)
+            svg_file.write_bytes(cached.read_bytes())
+        return svg_file
+
+    if not svg_file.exists():
+        latex_runs += 1
+    svg_file = Path(_original_tex_to_svg_file(expression, environment, tex_template))
+    svg_cache.put_file(key, ".svg", svg_file)
+    return svg_file
+
+
+def _path_key(mob, cache=path_cache):
+    # Same ingredients as SVGMobject.hash_seed, but with the file's content hash
+    # (its stem) instead of its location, which differs between checkouts
+    return cache.key(
+        Path(mob.file_name).stem,
+        repr(mob.svg_default),
+        repr(mob.path_string_config),
+        str(config.renderer),
+    )
+
+
+def _store_paths(mob, key, cache=path_cache):
+    paths = [sm for sm in mob.submobjects if sm.has_points()]
+    if len(paths) != len(mob.submobjects):
+        # Nested groups aren't something latex produces, don't try to flatten them
+        return
+
+    def write(f):
+        np.savez(
+            f,
+            counts=np.array([len(sm.points) for sm in paths], dtype=np.int64),
+            points=np.concatenate([sm.points for sm in paths]) if paths else np.zeros((0, 3)),
+            fill=np.array([sm.get_fill_rgbas()[0] for sm in paths]).reshape(-1, 4),
+            stroke=np.array([sm.get_stroke_rgbas()[0] for sm in paths]).reshape(-1, 4),
+            stroke_width=np.array([sm.get_stroke_width() for sm in paths]),
+        )
+
+    cache.put_with(key, ".npz", write)
+
+
+def _load_paths(mob, path):
+    with np.load(path) as data:
+        counts = data["counts"]
+        points = data["points"]
+        fill = data["fill"]
+        stroke = data["stroke"]
+        stroke_width = data["stroke_width"]
+
+    start = 0
+    submobjects = []
+    for i, count in enumerate(counts):
+        sm = VMobject()
+        sm.set_points(points[start:start + count])
+        sm.set_fill(rgba_to_color(fill[i]), opacity=fill[i][3])
+        sm.set_stroke(rgba_to_color(stroke[i]), width=stroke_width[i], opacity=stroke[i][3])
+        submobjects.append(sm)
+        start += count
+    mob.add(*submobjects)
+
+
+def cached_generate_mobject(self):
+    """Replacement for SingleStringMathTex.generate_mobject that skips SVG parsing on a hit."""
+    key = _path_key(self)
+    cached = path_cache.get(key, ".npz")
+    if cached is not None:
+        try:
+            _load_paths(self, cached)
+            return
+        except (OSError, ValueError, KeyError):
+            # Truncated or stale entry, just parse the SVG again
+            self.submobjects = []
+
+    _original_generate_mobject(self)
+    _store_paths(self, key)
+
+
+def report():
+    logger.info(f"tex cache: {svg_cache.hits} hits, {svg_cache.misses} misses, {latex_runs} latex runs")
+    path_cache.report()
+
+
+def install():
+    """Routes all Tex/MathTex compilation through the disk cache. Safe to call more than once."""
+    global _installed
+    if _installed:
+        return
+    tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+    SingleStringMathTex.generate_mobject = cached_generate_mobject
+    atexit.register(report)
+    _installed = True
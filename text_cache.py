@@ -0,0 +1,97 @@
+"""
+Persistent Pango text cache, the Text/Paragraph counterpart of tex_cache.py.
+
+Manim writes every shaped Text to an SVG in the media folder and parses it into
+paths again for every new mobject. This keeps both the SVG Pango produced and the
+parsed path data in disk caches shared by every checkout and render process, so
+a paragraph is only ever shaped and parsed once per distinct text and style.
+
+The SVG is keyed by everything manim hashes for its own file name: the text, font,
+slant, weight, color, per-substring styles, font size, line spacing and ligature
+setting, plus the ManimPango version. Paragraph's alignment isn't part of it: the
+lines are shaped the same either way and only shifted afterwards.
+
+Call install() once before building any text (cylinder_optimization.py does).
+"""
+import atexit
+from pathlib import Path
+
+import manimpango
+from manim import config, logger
+from manim.mobject.text.text_mobject import Text
+
+from disk_cache import DiskCache
+from tex_cache import _load_paths, _path_key, _store_paths
+
+svg_cache = DiskCache("text_svg")
+path_cache = DiskCache("text_paths")
+
+# Number of times Pango actually had to shape text in this process
+pango_runs = 0
+
+_original_text2svg = Text._text2svg
+_original_generate_mobject = Text.generate_mobject
+_installed = False
+
+
+def _svg_key(text, color):
+    return svg_cache.key(
+        manimpango.__version__,
+        text.text, text.font, text.slant, text.weight, str(color),
+        str(text.t2f), str(text.t2s), str(text.t2w), str(text.t2c),
+        text.line_spacing, text._font_size, text.disable_ligatures,
+    )
+
+
+def cached_text2svg(self, color):
+    """Replacement for Text._text2svg that goes through the disk cache."""
+    global pango_runs
+
+    key = _svg_key(self, color)
+    # Keep manim's own file naming, its other hashing (and remove_last_M) expects it
+    svg_file = config.get_dir("text_dir") / (self._text2hash(color) + ".svg")
+
+    cached = svg_cache.get(key, ".svg")
+    if cached is not None:
+        if not svg_file.exists():
+            svg_file.parent.mkdir(parents=True, exist_ok=True)
+            svg_file.write_bytes(cached.read_bytes())
+        return str(svg_file.resolve())
+
+    if not svg_file.exists():
+        pango_runs += 1
+    svg_file = Path(_original_text2svg(self, color))
+    svg_cache.put_file(key, ".svg", svg_file)
+    return str(svg_file)
+
+
+def cached_generate_mobject(self):
+    """Replacement for Text.generate_mobject that skips SVG parsing on a hit."""
+    key = _path_key(self, path_cache)
+    cached = path_cache.get(key, ".npz")
+    if cached is not None:
+        try:
+            _load_paths(self, cached)
+            return
+        except (OSError, ValueError, KeyError):
+            # Truncated or stale entry, just parse the SVG again
+            self.submobjects = []
+
+    _original_generate_mobject(self)
+    _store_paths(self, key, path_cache)
+
+
+def report():
+    logger.info(f"text cache: {svg_cache.hits} hits, {svg_cache.misses} misses, {pango_runs} pango runs")
+    path_cache.report()
+
+
+def install():
+    """Routes all Text/Paragraph shaping through the disk cache. Safe to call more than once."""
+    global _installed
+    if _installed:
+        return
+    Text._text2svg = cached_text2svg
+    Text.generate_mobject = cached_generate_mobject
+    atexit.register(report)
+    _installed = True
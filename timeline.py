@@ -0,0 +1,192 @@
+"""
+Timeline-only dry run, for syncing narration without rendering anything.
+
+Runs a scene's construct() with every animation skipped (so nothing is rasterized),
+no files written, and LaTeX replaced by placeholder glyphs: every tex expression
+becomes a row of boxes, roughly one per symbol, with one part per substring so
+indexing into MathTex parts works as usual. Positions are therefore approximate,
+timings are exact: they're manim's own renderer clock, the same one a full render
+advances.
+
+Every play() and wait() is recorded with the line of cylinder_optimization.py it was
+called from (waits through CanAnalysis.pause() get the line that called pause(), see
+source_lines.py), its start time and duration, and section starts are recorded too:
+
+    {"scene": "Salt", "duration": 151.2, "seconds_to_build": 0.4,
+     "sections": [{"name": "measurement", "start": 0.0}, ...],
+     "events": [{"index": 0, "kind": "play", "line": 612, "function": "measurement",
+                 "start": 0.0, "duration": 1.0, "end": 1.0,
+                 "animations": ["FadeIn"]}, ...]}
+
+Text (Pango) and images are still built for real.
+
+Usage:
+    python timeline.py [Scene ...] [-o timeline.json]
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+
+from source_lines import SOURCE_FILE, scene_line
+
+# Placeholder glyph size, in the SVG units latex output is in (a 10pt font)
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+
+# Anything that's probably one glyph: a command like \pi or a single character
+_GLYPH = re.compile(r"\\[A-Za-z]+|[^\s{}^_\\&]")
+
+_recording = None
+_installed = False
+
+
+def _placeholder_svg_file(expression, environment=None, tex_template=None):
+    # Never opened, it just has to be a distinct name per expression for manim's SVG cache
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash
+
+    return config.get_dir("tex_dir") / f"placeholder_{tex_hash(expression + str(environment))}.svg"
+
+
+def _placeholder_generate_mobject(self):
+    from manim import RIGHT, Rectangle
+
+    glyphs = max(len(_GLYPH.findall(self.tex_string)), 1)
+    self.add(*(
+        Rectangle(width=GLYPH_WIDTH * 0.8, height=GLYPH_HEIGHT).shift(RIGHT * GLYPH_WIDTH * i)
+        for i in range(glyphs)
+    ))
+
+
+def _placeholder_break_up_by_substrings(self):
+    # Latex would give the whole expression and its parts matching glyph counts,
+    # placeholders only roughly do, so the parts keep their own glyphs instead
+    from manim import RIGHT
+    from manim.mobject.text.tex_mobject import SingleStringMathTex
+
+    center = self.get_center()
+    parts = [
+        SingleStringMathTex(tex_string, tex_environment=self.tex_environment, tex_template=self.tex_template)
+        for tex_string in self.tex_strings
+    ]
+    self.submobjects = parts
+    self.arrange(RIGHT, buff=0.05).move_to(center)
+    return self
+
+
+def _recorded_play(play):
+    def wrapper(self, *args, **kwargs):
+        if _recording is None:
+            return play(self, *args, **kwargs)
+        line, function = scene_line()
+        start = self.renderer.time
+        play(self, *args, **kwargs)
+        animations = [type(animation).__name__ for animation in self.animations or ()]
+        _recording["events"].append({
+            "index": len(_recording["events"]),
+            "kind": "wait" if animations == ["Wait"] else "play",
+            "line": line,
+            "function": function,
+            "start": round(start, 6),
+            "duration": round(self.renderer.time - start, 6),
+            "end": round(self.renderer.time, 6),
+            "animations": animations,
+        })
+    return wrapper
+
+
+def _recorded_next_section(next_section):
+    def wrapper(self, name="unnamed", *args, **kwargs):
+        if _recording is not None:
+            _recording["sections"].append({"name": name, "start": round(self.renderer.time, 6)})
+        return next_section(self, name, *args, **kwargs)
+    return wrapper
+
+
+def install():
+    """Swaps in placeholder tex and starts recording play() calls. Safe to call more than once."""
+    global _installed
+    if _installed:
+        return
+
+    from manim import Scene
+    from manim.mobject.text import tex_mobject
+
+    # After the scenes are imported, so this wins over tex_cache.install()
+    import cylinder_optimization
+
+    tex_mobject.tex_to_svg_file = _placeholder_svg_file
+    tex_mobject.SingleStringMathTex.generate_mobject = _placeholder_generate_mobject
+    tex_mobject.MathTex._break_up_by_substrings = _placeholder_break_up_by_substrings
+    Scene.play = _recorded_play(Scene.play)
+    Scene.next_section = _recorded_next_section(Scene.next_section)
+    _installed = True
+
+
+def timeline(scene_name):
+    """
+    Runs a scene without rendering it and returns its timeline.
+
+    Args:
+    scene_name (str): Name of the scene class in cylinder_optimization.py, or the
+        class itself (e.g. one made by cans.can_scene()).
+
+    Returns:
+    dict: scene, duration, seconds_to_build, sections and events, as described above.
+    """
+    global _recording
+
+    from manim import tempconfig
+
+    import cylinder_optimization
+
+    install()
+    scene_class = scene_name
+    if isinstance(scene_name, str):
+        scene_class = getattr(cylinder_optimization, scene_name)
+
+    _recording = {"events": [], "sections": []}
+    start = time.perf_counter()
+    try:
+        with tempconfig({"input_file": str(SOURCE_FILE), "dry_run": True, "disable_caching": True}):
+            scene = scene_class(skip_animations=True)
+            scene.render()
+        recording = _recording
+    finally:
+        _recording = None
+
+    return {
+        "scene": scene_class.__name__,
+        "duration": round(scene.renderer.time, 6),
+        "seconds_to_build": round(time.perf_counter() - start, 3),
+        "sections": recording["sections"],
+        "events": recording["events"],
+    }
+
+
+def main(argv=None):
+    from render_all import SCENES
+
+    parser = argparse.ArgumentParser(description="Print the timeline of scenes without rendering them.")
+    parser.add_argument("scenes", nargs="*", help="Scenes to time (default: all of the video's)")
+    parser.add_argument("-o", "--output", default=None, help="Write the JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    timelines = [timeline(name) for name in args.scenes or [name for name, _ in SCENES]]
+    text = json.dumps(timelines, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+
+    for result in timelines:
+        print(f"{result['scene']}: {len(result['events'])} events, {result['duration']:.2f}s "
+              f"(built in {result['seconds_to_build']:.2f}s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Monte-Carlo spread of a can's volume efficiency under manufacturing tolerances.
+
+Draws perturbed (r, h) pairs around the nominal dimensions and runs them through
+efficiency.analyze(). Samples are made and reduced one fixed-size chunk at a time,
+so memory use doesn't depend on the sample count: every chunk only adds to a fine
+histogram of efficiencies (and running sums for the mean and spread). Percentiles
+are read off that histogram, to within one bin (0.01 percentage points by default).
+
+Tolerances are ± values in cm. With the normal distribution they're taken as 3σ,
+with the uniform one as hard limits.
+
+Usage:
+    python tolerance.py CanName [--r-tol CM] [--h-tol CM] [-n SAMPLES] [--uniform] [--seed N]
+"""
+import argparse
+import sys
+
+import numpy as np
+
+from efficiency import analyze
+
+PERCENTILES = (1, 5, 25, 50, 75, 95, 99)
+
+
+def _draw(rng, nominal, tolerance, size, distribution, dtype):
+    if distribution == "normal":
+        values = rng.normal(nominal, tolerance / 3, size)
+    elif distribution == "uniform":
+        values = rng.uniform(nominal - tolerance, nominal + tolerance, size)
+    else:
+        raise ValueError(f"Unknown distribution {distribution!r}, use normal or uniform")
+    return values.astype(dtype, copy=False)
+
+
+def simulate(r, h, r_tolerance, h_tolerance, samples=10_000_000, chunk_size=1_000_000,
+             distribution="normal", bins=10_000, keep=0, seed=None, dtype=np.float64):
+    """
+    Simulates the efficiency of cans made to (r, h) within the given tolerances.
+
+    Args:
+    r (float): Nominal radius in cm.
+    h (float): Nominal height in cm.
+    r_tolerance (float): ± tolerance on the radius in cm.
+    h_tolerance (float): ± tolerance on the height in cm.
+    samples (int): Number of simulated cans.
+    chunk_size (int): Cans simulated at once, which bounds the memory used.
+    distribution (str): "normal" (tolerance = 3σ) or "uniform".
+    bins (int): Histogram bins between efficiency 0 and 1.
+    keep (int): How many individual efficiencies to return as well, e.g. for plotting.
+    seed (int): Random seed, for reproducible runs.
+    dtype (np.dtype): float64, or float32 for less memory and time.
+
+    Returns:
+    dict: samples, mean, std, min, max, percentiles ({q: efficiency}), counts and
+        edges (the histogram) and sample (the first `keep` efficiencies). Efficiencies
+        are fractions, not percentages.
+    """
+    rng = np.random.default_rng(seed)
+    counts = np.zeros(bins, dtype=np.int64)
+    total = 0.0
+    total_squares = 0.0
+    lowest = np.inf
+    highest = -np.inf
+    kept = []
+    kept_count = 0
+
+    done = 0
+    while done < samples:
+        size = min(chunk_size, samples - done)
+        efficiency = analyze(
+            _draw(rng, r, r_tolerance, size, distribution, dtype),
+            _draw(rng, h, h_tolerance, size, distribution, dtype),
+            dtype,
+        )["efficiency"]
+
+        indices = (efficiency * bins).astype(np.int64)
+        np.clip(indices, 0, bins - 1, out=indices)
+        counts += np.bincount(indices, minlength=bins)
+        total += efficiency.sum(dtype=np.float64)
+        total_squares += np.square(efficiency, dtype=np.float64).sum()
+        lowest = min(lowest, float(efficiency.min()))
+        highest = max(highest, float(efficiency.max()))
+        if kept_count < keep:
+            kept.append(efficiency[:keep - kept_count].copy())
+            kept_count += len(kept[-1])
+        done += size
+
+    edges = np.linspace(0, 1, bins + 1)
+    mean = total / samples if samples else np.nan
+    return {
+        "samples": samples,
+        "mean": mean,
+        "std": np.sqrt(max(total_squares / samples - mean ** 2, 0)) if samples else np.nan,
+        "min": lowest,
+        "max": highest,
+        "percentiles": {q: percentile(counts, edges, q) for q in PERCENTILES},
+        "counts": counts,
+        "edges": edges,
+        "sample": np.concatenate(kept) if kept else np.empty(0, dtype=dtype),
+    }
+
+
+def percentile(counts, edges, q):
+    """
+    Reads the q-th percentile off a histogram, interpolating inside the bin it falls in.
+
+    Args:
+    counts (np.ndarray): Histogram counts.
+    edges (np.ndarray): Bin edges, one more than counts.
+    q (float): Percentile, 0 to 100.
+
+    Returns:
+    float: The estimated value.
+    """
+    cumulative = np.cumsum(counts)
+    if not cumulative[-1]:
+        return np.nan
+    target = q / 100 * cumulative[-1]
+    i = min(int(np.searchsorted(cumulative, target)), len(counts) - 1)
+    below = cumulative[i - 1] if i else 0
+    fraction = (target - below) / counts[i] if counts[i] else 0
+    return edges[i] + fraction * (edges[i + 1] - edges[i])
+
+
+def histogram(result, bins=40):
+    """
+    Coarsens a simulation's fine histogram to about `bins` bins over the range it covers.
+
+    Returns:
+    tuple: (counts, edges)
+    """
+    counts, edges = result["counts"], result["edges"]
+    occupied = np.flatnonzero(counts)
+    if not len(occupied):
+        return counts[:0], edges[:1]
+    first, last = occupied[0], occupied[-1] + 1
+    group = -(-(last - first) // bins)
+    starts = np.arange(first, last, group)
+    # reduceat sums each group up to the next start, everything past `last` is empty anyway
+    coarse = np.add.reduceat(counts, starts)
+    return coarse, edges[np.append(starts, min(starts[-1] + group, len(counts)))]
+
+
+def main(argv=None):
+    from cans import load_catalog
+
+    parser = argparse.ArgumentParser(description="Spread of a can's volume efficiency under manufacturing tolerances.")
+    parser.add_argument("can", help="A can from cans.json")
+    parser.add_argument("--r-tol", type=float, default=0.05, help="± tolerance on r in cm")
+    parser.add_argument("--h-tol", type=float, default=0.1, help="± tolerance on h in cm")
+    parser.add_argument("-n", "--samples", type=int, default=10_000_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    parser.add_argument("--uniform", action="store_true", help="Uniform instead of normal (3σ) tolerances")
+    parser.add_argument("--float32", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    can = load_catalog()[args.can]
+    result = simulate(
+        can["r"], can["h"], args.r_tol, args.h_tol, args.samples, args.chunk_size,
+        "uniform" if args.uniform else "normal", seed=args.seed,
+        dtype=np.float32 if args.float32 else np.float64,
+    )
+
+    print(f"{args.can}: {result['samples']} cans, efficiency {result['mean']:.2%} ± {result['std']:.2%} "
+          f"(min {result['min']:.2%}, max {result['max']:.2%})")
+    for q, value in result["percentiles"].items():
+        print(f"  p{q:<3}{value:8.2%}")
+    counts, edges = histogram(result)
+    width = 50 / counts.max()
+    for count, left in zip(counts, edges):
+        print(f"  {left:7.2%} {'#' * int(round(count * width))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())